@@ -3,12 +3,16 @@ Module to define beam class helpers.
 
 This includes:
 - The BeamClass dataclass
-- beamclasses, a list of available beam classes in order
+- get_beam_classes, which returns a list of available beam classes in order
 - summarize_beam_class_bitmask, a function that returns a str table that
   explains the impact of a specific beam class bitmask.
 """
+import csv
 import dataclasses
-from typing import Optional, Union, get_args, get_origin
+import functools
+import io
+from typing import (Any, Callable, ClassVar, Optional, Union, get_args,
+                    get_origin)
 
 from prettytable import PrettyTable
 
@@ -40,30 +44,44 @@ class BeamClass:
     int_energy: Optional[float]
     notes: Optional[str]
 
+    # One type conversion function per field, see _get_coercer
+    _coercers: ClassVar[list[Callable[[Any], Any]]]
+
     @classmethod
     def from_strs(cls, *args):
         """
         Load a beamclass from a list of strings that match the fields.
         """
-        # Coerce the types
-        new_args = []
-        for value, field in zip(args, dataclasses.fields(cls)):
-            origin = get_origin(field.type)
-            # Normal types
-            if origin is None:
-                new_args.append(field.type(value))
-            # Optional
-            elif origin is Union:
-                if value is None:
-                    new_args.append(None)
-                else:
-                    the_type = get_args(field.type)[0]
-                    new_args.append(the_type(value))
-            else:
-                raise NotImplementedError(
-                    'You added to this class without thinking about this function!'
-                )
-        return cls(*new_args)
+        return cls(*[coerce(value) for coerce, value in zip(cls._coercers, args)])
+
+
+def _get_coercer(field_type: Any) -> Callable[[Any], Any]:
+    """
+    Get a function that converts a string to the type of a BeamClass field.
+    """
+    origin = get_origin(field_type)
+    # Normal types
+    if origin is None:
+        return field_type
+    # Optional
+    elif origin is Union:
+        the_type = get_args(field_type)[0]
+
+        def coerce_optional(value):
+            if value is None:
+                return None
+            return the_type(value)
+
+        return coerce_optional
+    else:
+        raise NotImplementedError(
+            'You added to BeamClass without thinking about this function!'
+        )
+
+
+BeamClass._coercers = [
+    _get_coercer(field.type) for field in dataclasses.fields(BeamClass)
+]
 
 
 # Copied from https://confluence.slac.stanford.edu/pages/viewpage.action?pageId=341246543 and tweaked
@@ -89,16 +107,21 @@ table = """
 15	Spare	-	-	-	-	-	-	-	-
 """
 
-beam_classes: list[BeamClass] = []
 
-for line in table.split('\n'):
-    if not line:
-        continue
-    entries = line.split('\t')
-    for i, entry in enumerate(entries):
-        if entry == '-':
-            entries[i] = None
-    beam_classes.append(BeamClass.from_strs(*entries))
+@functools.cache
+def get_beam_classes() -> list[BeamClass]:
+    """
+    Get the list of available beam classes in order.
+
+    The table is parsed on the first call and cached for later calls.
+    """
+    beam_classes = []
+    for row in csv.reader(io.StringIO(table.strip()), delimiter='\t'):
+        if not row:
+            continue
+        entries = [None if entry == '-' else entry for entry in row]
+        beam_classes.append(BeamClass.from_strs(*entries))
+    return beam_classes
 
 
 def summarize_beam_class_bitmask(bitmask: int) -> str:
@@ -124,6 +147,7 @@ def summarize_beam_class_bitmask(bitmask: int) -> str:
             row_data.append(value)
         table.add_row(row_data)
 
+    beam_classes = get_beam_classes()
     # First row is no beam, which is always ok
     add_row(ok=True, beam_class=beam_classes[0])
     # The rest of the rows check the bitmask
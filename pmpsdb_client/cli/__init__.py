@@ -6,18 +6,41 @@ It can also be run via ``python -m pmpsdb`` from the repository root if you
 have not or cannot install it.
 """
 import argparse
+import importlib
 import logging
+import sys
 
-from .parser import create_parser
+from .parser import create_parser, sniff_subcommand
 
 logger = logging.getLogger(__name__)
 
+# Top-level arguments that are allowed alongside --version in the fast path
+VERSION_ONLY_ARGS = {'--version', '--verbose', '-v'}
+
+# Subcommand name to (module, function), the module is imported only when used
+SUBCOMMANDS = {
+    'gui': ('.run_gui', 'run_gui'),
+    'list-files': ('.transfer_tools', 'cli_list_files'),
+    'upload-to': ('.transfer_tools', 'cli_upload_file'),
+    'download-from': ('.transfer_tools', 'cli_download_file'),
+    'compare': ('.transfer_tools', 'cli_compare_file'),
+    'reload': ('.epics_tools', 'cli_reload_parameters'),
+}
+
 
 def entrypoint() -> int:
     """
     This is the function called when you run ``pmpsdb``
     """
-    return main(create_parser().parse_args())
+    argv = sys.argv[1:]
+    # Fast path: no need to build the parser to show the version
+    if '--version' in argv and set(argv) <= VERSION_ONLY_ARGS:
+        from ..version import version
+        print(version)
+        return 0
+    # Only build the arguments for the subcommand we're running
+    parser = create_parser(sniff_subcommand(argv))
+    return main(parser.parse_args(argv))
 
 
 def main(args: argparse.Namespace) -> int:
@@ -51,7 +74,8 @@ def _main(args: argparse.Namespace) -> int:
             level=logging.DEBUG,
             format="%(asctime)s %(levelname)s: %(name)s %(message)s",
         )
-    else:
+    elif args.subparser == 'gui':
+        # The gui status bar shows INFO messages
         logging.basicConfig(
             level=logging.INFO,
             format='%(levelname)s: %(message)s',
@@ -59,25 +83,14 @@ def _main(args: argparse.Namespace) -> int:
         # Noisy log messages from ssh transport layer
         for module in ("fabric", "paramiko", "intake"):
             logging.getLogger(module).setLevel(logging.WARNING)
+    # Otherwise, skip the setup: the other commands print their results,
+    # and warnings and errors still reach stderr through logging's fallback.
     if args.export_dir:
         from ..export_data import set_export_dir
         set_export_dir(args.export_dir)
-    if args.subparser == 'gui':
-        from .run_gui import run_gui
-        return run_gui(args)
-    if args.subparser == 'list-files':
-        from .transfer_tools import cli_list_files
-        return cli_list_files(args)
-    if args.subparser == 'upload-to':
-        from .transfer_tools import cli_upload_file
-        return cli_upload_file(args)
-    if args.subparser == 'download-from':
-        from .transfer_tools import cli_download_file
-        return cli_download_file(args)
-    if args.subparser == 'compare':
-        from .transfer_tools import cli_compare_file
-        return cli_compare_file(args)
-    if args.subparser == 'reload':
-        from .epics_tools import cli_reload_parameters
-        return cli_reload_parameters(args)
-    return 1
+    try:
+        module_name, func_name = SUBCOMMANDS[args.subparser]
+    except KeyError:
+        return 1
+    module = importlib.import_module(module_name, package=__name__)
+    return getattr(module, func_name)(args)
@@ -2,18 +2,17 @@
 CLI entry points that involve EPICS
 """
 import argparse
+import functools
 import logging
-import re
 import threading
 import time
 from pathlib import Path
 
-import yaml
-
 from ..ioc_data import PLCDBControls
 
 logger = logging.getLogger(__name__)
-CONFIG_RE = re.compile(r'^pmpsdb_.*.yml$')
+# The built-in pmpsdb_*.yml configs live at the top of the package
+CONFIG_DIR = Path(__file__).parent.parent
 
 
 def cli_reload_parameters(args: argparse.Namespace) -> int:
@@ -35,22 +34,39 @@ def cli_reload_parameters(args: argparse.Namespace) -> int:
         )
         return 1
     last_refresh = controls.last_refresh.get()
-    logger.info(
-        'Last file reloaded at: %s',
-        time.ctime(last_refresh)
-    )
+    print(f'Last file reloaded at: {time.ctime(last_refresh)}')
+
+    if args.no_wait:
+        return _refresh(controls)
+
+    ev = threading.Event()
 
-    if not args.no_wait:
-        ev = threading.Event()
+    def set_flag(*args, value, **kwargs):
+        if value != last_refresh:
+            ev.set()
 
-        def set_flag(*args, value, **kwargs):
-            if value != last_refresh:
-                ev.set()
+    controls.last_refresh.subscribe(set_flag)
+    try:
+        if _refresh(controls):
+            return 1
+        if not ev.wait(5.0):
+            logger.error(
+                'Timeout while waiting for %s to refresh',
+                hostname,
+            )
+            return 1
+    finally:
+        controls.last_refresh.clear_sub(set_flag)
+    print(f'This file reloaded at: {time.ctime(controls.last_refresh.get())}')
+    return 0
 
-        controls.last_refresh.subscribe(set_flag)
 
+def _refresh(controls: PLCDBControls) -> int:
+    """
+    Ask the PLC to reload its database file, returning an error code.
+    """
     try:
-        logger.info('Refreshing...')
+        print('Refreshing...')
         controls.refresh.put(1)
     except Exception:
         logger.error(
@@ -58,32 +74,28 @@ def cli_reload_parameters(args: argparse.Namespace) -> int:
             controls.refresh.pvname,
         )
         return 1
-
-    if not args.no_wait:
-        try:
-            ev.wait(5.0)
-        except Exception:
-            logger.error(
-                'Timeout while waiting for %s to refresh',
-                hostname,
-            )
-            return 1
-        else:
-            logger.info(
-                'This file reloaded at: %s',
-                time.ctime(controls.last_refresh.get())
-            )
     return 0
 
 
+@functools.lru_cache(maxsize=1)
 def load_all_configs() -> dict[str, str]:
     """
     Check all the built-in configs to gather all of the PV prefixes.
+
+    The result is cached, so callers should not modify it.
     """
     configs = {}
-    root_path = Path(__file__).parent.parent
-    for path in root_path.iterdir():
-        if CONFIG_RE.match(path.name) is not None:
-            with path.open() as fd:
-                configs.update(yaml.full_load(fd))
+    paths = list(CONFIG_DIR.glob('pmpsdb_*.yml'))
+    if not paths:
+        return configs
+    # yaml is slow to import, only load it if there is something to parse
+    import yaml
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        # PyYAML was built without libyaml
+        loader = yaml.SafeLoader
+    for path in paths:
+        with path.open() as fd:
+            configs.update(yaml.load(fd, Loader=loader))
     return configs
@@ -1,9 +1,14 @@
 import argparse
+from typing import Optional
 
 
-def create_parser() -> argparse.ArgumentParser:
+def create_parser(subcommand: Optional[str] = None) -> argparse.ArgumentParser:
     """
     Create the parser used to process command-line input.
+
+    Every subcommand is always listed, but if subcommand is given
+    we only add the arguments for that one.
+    Use sniff_subcommand to pick this from the command line.
     """
     parser = argparse.ArgumentParser(
         prog='pmpsdb',
@@ -26,19 +31,47 @@ def create_parser() -> argparse.ArgumentParser:
     )
 
     subparsers = parser.add_subparsers(dest='subparser')
+    for name, (help_text, add_arguments) in SUBPARSERS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if subcommand is None or subcommand == name:
+            add_arguments(subparser)
 
-    gui = subparsers.add_parser(
-        'gui',
-        help='Open the pmpsdb gui.',
-    )
-    gui.add_argument(
+    return parser
+
+
+def sniff_subcommand(argv: list[str]) -> Optional[str]:
+    """
+    Find which subcommand is being used without parsing the arguments.
+
+    Returns the subcommand name, an empty string if there is no subcommand,
+    or None if we can't tell and all subcommands should be built.
+    """
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg == '-e' or (arg.startswith('--e') and '--export-dir'.startswith(arg)):
+            # This option takes a value
+            skip_next = True
+        elif not arg.startswith('-'):
+            if arg in SUBPARSERS:
+                return arg
+            return None
+    return ''
+
+
+def add_gui_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments for the gui subcommand.
+    """
+    subparser.add_argument(
         '--config', '--cfg',
         action='append',
         help=(
             'Add a configuration file that maps hostnames to IOC PREFIX.'
         ),
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--tst',
         action='store_true',
         help=(
@@ -47,12 +80,12 @@ def create_parser() -> argparse.ArgumentParser:
             'tst is the default.'
         ),
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--all-prod', '--all',
         action='store_true',
         help='Load all included non-test PLC configuration files.'
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--lfe-all',
         action='store_true',
         help=(
@@ -60,7 +93,7 @@ def create_parser() -> argparse.ArgumentParser:
             'This will include the lfe config and any relevant hutch configs. '
         )
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--lfe',
         action='store_true',
         help=(
@@ -68,7 +101,7 @@ def create_parser() -> argparse.ArgumentParser:
             'This is the default if we are on lfe-console. '
         ),
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--kfe-all',
         action='store_true',
         help=(
@@ -76,7 +109,7 @@ def create_parser() -> argparse.ArgumentParser:
             'This will include the kfe config and any relevant hutch configs. '
         )
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--kfe',
         action='store_true',
         help=(
@@ -84,7 +117,7 @@ def create_parser() -> argparse.ArgumentParser:
             'This is the default if we are on kfe-console. '
         ),
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--tmo',
         action='store_true',
         help=(
@@ -92,7 +125,7 @@ def create_parser() -> argparse.ArgumentParser:
             'This is the default if we are on a tmo operator console.'
         ),
     )
-    gui.add_argument(
+    subparser.add_argument(
         '--rix',
         action='store_true',
         help=(
@@ -101,78 +134,95 @@ def create_parser() -> argparse.ArgumentParser:
         ),
     )
 
-    list_files = subparsers.add_parser(
-        'list-files',
-        help='Show all files uploaded to a PLC.',
-    )
-    list_files.add_argument(
+
+def add_list_files_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments for the list-files subcommand.
+    """
+    subparser.add_argument(
         'hostname',
         help='PLC hostname to check.'
     )
 
-    upload = subparsers.add_parser(
-        'upload-to',
-        help='Upload a database export file to a PLC.'
-    )
-    upload.add_argument(
+
+def add_upload_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments for the upload-to subcommand.
+    """
+    subparser.add_argument(
         'hostname',
         help='PLC hostname to upload to.'
     )
-    upload.add_argument(
-        '--local-file',
-        help=(
-            'Full path to the local file you want to upload. '
-            'If omitted, we will upload the latest database export.'
-        ),
-    )
-    upload.add_argument(
-        '--plc-filename',
-        help=(
-            'Name of the file on the PLC end. '
-            'If omitted, this will be the standard export name '
-            'if we can figure it out from the local filename, '
-            'or the default name the PLC loads the database from otherwise.'
-        ),
-    )
+    add_export_file_arguments(subparser, verb='upload')
 
-    download = subparsers.add_parser(
-        'download-from',
-        help='Download a database file previously exported to a PLC.'
-    )
-    download.add_argument(
+
+def add_download_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments for the download-from subcommand.
+    """
+    subparser.add_argument(
         'hostname',
         help='PLC hostname to download from.'
     )
-    download.add_argument(
+    subparser.add_argument(
         '--plc-filename',
         help=(
             'Name of the file on the PLC end. '
             'If omitted, this will be the default name the PLC loads the database from.'
         ),
     )
-    download.add_argument(
+    subparser.add_argument(
         '--local-file',
         help=(
             'Full path to save locally. If omitted, download to stdout.'
         ),
     )
 
-    compare = subparsers.add_parser(
-        'compare',
-        help='Compare files beteween the local exports and the PLC.'
-    )
-    compare.add_argument(
+
+def add_compare_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments for the compare subcommand.
+    """
+    subparser.add_argument(
         'hostname',
         help='PLC hostname to compare with.'
     )
-    compare.add_argument(
+    add_export_file_arguments(subparser, verb='compare')
+
+
+def add_reload_arguments(subparser: argparse.ArgumentParser) -> None:
+    """
+    Add the arguments for the reload subcommand.
+    """
+    subparser.add_argument(
+        'hostname',
+        help='PLC hostname to reload parameters for.'
+    )
+    subparser.add_argument(
+        '--no-wait',
+        action='store_true',
+        help='Do not wait for confirmation',
+    )
+
+
+def add_export_file_arguments(
+    subparser: argparse.ArgumentParser,
+    verb: str,
+) -> None:
+    """
+    Add the local/plc filename arguments shared by upload-to and compare.
+
+    Both commands default to the latest database export and to the
+    standard PLC filename, see transfer_tools.default_upload_naming.
+    """
+    subparser.add_argument(
         '--local-file',
         help=(
-            'Full path to the local file you want to compare. '
-            'If omitted, we will use the latest database export.'
+            f'Full path to the local file you want to {verb}. '
+            f'If omitted, we will {verb} the latest database export.'
         ),
     )
-    compare.add_argument(
+    subparser.add_argument(
         '--plc-filename',
         help=(
             'Name of the file on the PLC end. '
@@ -182,18 +232,31 @@ def create_parser() -> argparse.ArgumentParser:
         ),
     )
 
-    reload = subparsers.add_parser(
-        'reload',
-        help='Force the PLC to re-read the database export while running.'
-    )
-    reload.add_argument(
-        'hostname',
-        help='PLC hostname to reload parameters for.'
-    )
-    reload.add_argument(
-        '--no-wait',
-        action='store_true',
-        help='Do not wait for confirmation',
-    )
 
-    return parser
+# Subcommand name to (help text, function that adds its arguments)
+SUBPARSERS = {
+    'gui': (
+        'Open the pmpsdb gui.',
+        add_gui_arguments,
+    ),
+    'list-files': (
+        'Show all files uploaded to a PLC.',
+        add_list_files_arguments,
+    ),
+    'upload-to': (
+        'Upload a database export file to a PLC.',
+        add_upload_arguments,
+    ),
+    'download-from': (
+        'Download a database file previously exported to a PLC.',
+        add_download_arguments,
+    ),
+    'compare': (
+        'Compare files beteween the local exports and the PLC.',
+        add_compare_arguments,
+    ),
+    'reload': (
+        'Force the PLC to re-read the database export while running.',
+        add_reload_arguments,
+    ),
+}
@@ -4,12 +4,9 @@ CLI entry points to the various tools for moving files around.
 import argparse
 import logging
 import os.path
+import sys
 from typing import Optional
 
-from ..export_data import ExportFile, get_latest_exported_files
-from ..plc_data import (compare_file, download_file_text, list_file_info,
-                        upload_filename)
-
 logger = logging.getLogger(__name__)
 
 
@@ -19,6 +16,7 @@ def cli_list_files(args: argparse.Namespace) -> int:
 
 
 def _list_files(hostname: str) -> int:
+    from ..plc_data import list_file_info
     infos = list_file_info(hostname=hostname)
     for data in infos:
         print(
@@ -59,18 +57,19 @@ def _upload_file(
         if we can figure it out from the local filename,
         or the default name the PLC loads the database from otherwise.
     """
+    from ..plc_data import upload_filename
     local_file, plc_filename = default_upload_naming(
         hostname=hostname,
         local_file=local_file,
         plc_filename=plc_filename,
     )
-    logger.info('Uploading %s to %s as %s', local_file, hostname, plc_filename)
+    print(f'Uploading {local_file} to {hostname} as {plc_filename}')
     upload_filename(
         hostname=hostname,
         filename=local_file,
         dest_filename=plc_filename,
     )
-    logger.info('Checking PLC files')
+    print('Checking PLC files')
     return _list_files(hostname=hostname)
 
 
@@ -100,13 +99,24 @@ def _download_file(
         Name of the file on the PLC end.
         If omitted, this will be the default name the PLC loads the database from.
     """
+    from ..plc_data import download_file_stream
     plc_filename = plc_filename or default_load_name(hostname)
-    text = download_file_text(hostname=hostname, filename=plc_filename)
     if local_file is None:
-        print(text)
+        sys.stdout.flush()
+        download_file_stream(
+            hostname=hostname,
+            filename=plc_filename,
+            stream=sys.stdout.buffer,
+        )
+        sys.stdout.buffer.write(b'\n')
+        sys.stdout.flush()
     else:
-        with open(local_file, 'w') as fd:
-            fd.write(text)
+        with open(local_file, 'wb') as fd:
+            download_file_stream(
+                hostname=hostname,
+                filename=plc_filename,
+                stream=fd,
+            )
     return 0
 
 
@@ -139,6 +149,7 @@ def _compare(
         if we can figure it out from the local filename,
         or the default name the PLC loads the database from otherwise.
     """
+    from ..plc_data import compare_file
     local_file, plc_filename = default_upload_naming(
         hostname=hostname,
         local_file=local_file,
@@ -150,11 +161,7 @@ def _compare(
         plc_filename=plc_filename,
     )
     if same:
-        logger.info(
-            'Local file %s matches PLC file %s',
-            local_file,
-            plc_filename,
-        )
+        print(f'Local file {local_file} matches PLC file {plc_filename}')
     else:
         logger.error(
             'Local file %s does not match PLC file %s',
@@ -190,6 +197,7 @@ def default_upload_naming(
     local_file, plc_filename : tuple of str
         The filenames as used in the other functions.
     """
+    from ..export_data import ExportFile, get_latest_exported_files
     if local_file is None:
         latest_files = get_latest_exported_files()
         try:
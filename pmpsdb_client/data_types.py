@@ -7,11 +7,32 @@ even when this data comes from different sources.
 Note that all the dataclasses are frozen: editing these data
 structures is not in scope for this library, it is only intended
 to move these files around and compare them to each other.
+
+They also define __slots__ to keep each instance small.
+We can't use dataclass(slots=True) until we drop python 3.9,
+so subclasses need to list their own new fields in __slots__.
 """
 import dataclasses
 import datetime
 
 
+def slots_getstate(self) -> list:
+    """
+    Pickle/copy helper for frozen dataclasses that define __slots__.
+    """
+    return [getattr(self, field.name) for field in dataclasses.fields(self)]
+
+
+def slots_setstate(self, state: list) -> None:
+    """
+    Pickle/copy helper for frozen dataclasses that define __slots__.
+
+    The normal setattr would raise FrozenInstanceError.
+    """
+    for field, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
 @dataclasses.dataclass(frozen=True)
 class FileInfo:
     """
@@ -23,6 +44,10 @@ class FileInfo:
     Each data source will need to implement a unique
     constructor for this.
     """
+    __slots__ = ('filename', 'size', 'last_changed')
+    __getstate__ = slots_getstate
+    __setstate__ = slots_setstate
+
     filename: str
     size: int
     last_changed: datetime.datetime
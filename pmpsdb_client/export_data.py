@@ -18,6 +18,8 @@ DEFAULT_EXPORT_DIR = "/cds/group/pcds/pyps/apps/pmpsdb_server/pmps-db/export"
 # Example filename: exported_plc-kfe-gatt-2023-01-19T16:22:00.673108.json
 FILE_FORMAT_RE = re.compile(r"^exported_(.*)-(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})\.(\d{6}).json$")
 _export_dir = None
+# (export dir, listing fingerprint) -> latest exports, see get_latest_exported_files
+_latest_exports_cache: tuple[tuple, dict[str, ExportFile]] | None = None
 
 
 def get_export_dir() -> str:
@@ -92,6 +94,35 @@ def select_latest_exported_files(all_exports: list[ExportFile]) -> dict[str, Exp
     return dict(latest_exports)
 
 
+def get_export_fingerprint() -> tuple:
+    """
+    Summarize the export directory listing for cache checks.
+
+    This is the sorted names, sizes, and mtimes of the files. We can't
+    use the directory's own mtime because it only has one second
+    resolution on some of the NFS mounts we export to.
+    """
+    export_dir = get_export_dir()
+    with os.scandir(export_dir) as entries:
+        listing = []
+        for entry in entries:
+            stat = entry.stat()
+            listing.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    return (export_dir, tuple(sorted(listing)))
+
+
 def get_latest_exported_files() -> dict[str, ExportFile]:
-    """Get the latest file for each PLC."""
-    return select_latest_exported_files(get_exported_files())
+    """
+    Get the latest file for each PLC.
+
+    The result is reused until the export directory listing changes,
+    see get_export_fingerprint.
+    """
+    global _latest_exports_cache
+    key = get_export_fingerprint()
+    if _latest_exports_cache is None or _latest_exports_cache[0] != key:
+        _latest_exports_cache = (
+            key,
+            select_latest_exported_files(get_exported_files()),
+        )
+    return dict(_latest_exports_cache[1])
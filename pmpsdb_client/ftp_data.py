@@ -7,15 +7,18 @@ FTP server.
 """
 from __future__ import annotations
 
+import atexit
 import datetime
 import ftplib
 import logging
 import os
 from contextlib import contextmanager
 from dataclasses import dataclass
+from io import BytesIO
 from typing import BinaryIO, Iterator, TypeVar
 
 from .data_types import FileInfo
+from .pool import ConnectionPool
 
 DEFAULT_PW = (
     ('Administrator', '1'),
@@ -27,12 +30,36 @@ logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
 
+class FTPPool(ConnectionPool[ftplib.FTP]):
+    """
+    Keep logged-in FTP connections around so they can be reused.
+
+    Opening a connection costs a TCP handshake plus a login, which is
+    most of the time spent on the small transfers we do here.
+    Idle connections are checked with a NOOP before they are reused.
+    See ConnectionPool for the parameters.
+    """
+    def connect(self, hostname: str, directory: str | None) -> ftplib.FTP:
+        return connect(hostname=hostname, directory=directory)
+
+    def check(self, ftp_obj: ftplib.FTP) -> bool:
+        ftp_obj.voidcmd('NOOP')
+        return True
+
+    def close(self, ftp_obj: ftplib.FTP) -> None:
+        close(ftp_obj)
+
+
+FTP_POOL = FTPPool()
+atexit.register(FTP_POOL.close_all)
+
+
 @contextmanager
 def ftp(hostname: str, directory: str | None = None) -> Iterator[ftplib.FTP]:
     """
     Context manager that manages an FTP connection.
 
-    The connection will be opened and closed cleanly.
+    The connection is taken from and returned to FTP_POOL.
     This will be used as a helper in other functions.
 
     Parameters
@@ -49,6 +76,29 @@ def ftp(hostname: str, directory: str | None = None) -> Iterator[ftplib.FTP]:
         An active FTP instance that can be used to read and write files.
     """
     logger.debug('ftp(%s, %s)', hostname, directory)
+    directory = directory or DIRECTORY
+    with FTP_POOL.acquire(hostname=hostname, directory=directory) as ftp_obj:
+        yield ftp_obj
+
+
+def connect(hostname: str, directory: str | None = None) -> ftplib.FTP:
+    """
+    Open a new FTP connection and move into our directory.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to connect to.
+    directory : str, optional
+        The ftp subdirectory to read to and write from.
+        A default directory pmps is used if this argument is omitted.
+
+    Returns
+    -------
+    ftp : ftplib.FTP
+        An active FTP instance that can be used to read and write files.
+    """
+    logger.debug('connect(%s, %s)', hostname, directory)
     # Default directory
     directory = directory or DIRECTORY
     # Create without connecting
@@ -76,8 +126,13 @@ def ftp(hostname: str, directory: str | None = None) -> Iterator[ftplib.FTP]:
     # Put us into the proper directory
     ftp_obj.cwd(directory)
     # Should be ready to go
-    yield ftp_obj
-    # Cleanup
+    return ftp_obj
+
+
+def close(ftp_obj: ftplib.FTP) -> None:
+    """
+    Close an FTP connection, politely if possible.
+    """
     try:
         # Polite cleanup
         ftp_obj.quit()
@@ -121,6 +176,8 @@ class FTPFileInfo(FileInfo):
     This protocol is what limits the amount of fields we can assume
     are available when we don't know the PLC's type.
     """
+    __slots__ = ()
+
     @classmethod
     def from_list_line(cls: type[T], line: str) -> T:
         """
@@ -285,10 +342,46 @@ def download_file_text(
         filename,
         directory,
     )
-    byte_chunks = []
+    bytesio = BytesIO()
+    download_file_stream(
+        hostname=hostname,
+        filename=filename,
+        stream=bytesio,
+        directory=directory,
+    )
+    return bytesio.getvalue().decode('ascii')
+
+
+def download_file_stream(
+    hostname: str,
+    filename: str,
+    stream: BinaryIO,
+    directory: str | None = None,
+) -> None:
+    """
+    Download a file from the PLC, writing the bytes to an open stream.
+
+    The file is written chunk by chunk as it arrives, so the full
+    contents are never held in memory.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to download from.
+    filename : str
+        The name of the file on the PLC.
+    stream : file-like object
+        A writable binary file-like object, such as sys.stdout.buffer.
+    directory : str, optional
+        The ftp subdirectory to read and write from
+        A default directory pmps is used if this argument is omitted.
+    """
+    logger.debug(
+        'download_file_stream(%s, %s, %s, %s)',
+        hostname,
+        filename,
+        stream,
+        directory,
+    )
     with ftp(hostname=hostname, directory=directory) as ftp_obj:
-        ftp_obj.retrbinary(f'RETR {filename}', byte_chunks.append)
-    contents = ''
-    for chunk in byte_chunks:
-        contents += chunk.decode('ascii')
-    return contents
+        ftp_obj.retrbinary(f'RETR {filename}', stream.write)
@@ -5,36 +5,43 @@ This is the locally run interface that allows us to communicate
 with both the database and the PLCs, showing useful diagnostic
 information and allowing file transfers.
 """
-import copy
+import collections
+import concurrent.futures
 import datetime
 import enum
+import functools
 import logging
 import os
 import os.path
+import re
 import socket
-import subprocess
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Optional
 
 import yaml
 from ophyd.utils.epics_pvs import AlarmSeverity
-from pcdscalc.pmps import get_bitmask_desc
 from pcdsutils.qt import DesignerDisplay
-from qtpy.QtCore import Qt
+from qtpy.QtCore import QObject, Qt, QTimer, Signal
 from qtpy.QtWidgets import (QAction, QDialog, QFileDialog, QInputDialog,
                             QLabel, QListWidget, QListWidgetItem, QMainWindow,
-                            QMessageBox, QStatusBar, QTableWidget,
-                            QTableWidgetItem, QWidget)
+                            QMessageBox, QProgressDialog, QStatusBar,
+                            QTableWidget, QTableWidgetItem, QWidget)
 
-from .beam_class import summarize_beam_class_bitmask
 from .export_data import ExportFile, get_export_dir, get_latest_exported_files
 from .ioc_data import AllStateBP, PLCDBControls
 from .plc_data import (download_file_json_dict, download_file_text,
-                       list_file_info, upload_filename)
+                       list_file_info_cached, upload_filename)
+
+try:
+    YamlLoader = yaml.CSafeLoader
+except AttributeError:
+    # PyYAML was built without libyaml
+    YamlLoader = yaml.SafeLoader
 
 logger = logging.getLogger(__name__)
+ERRNO_RE = re.compile(r'^\[Errno -?\d+\]\s*(.*)$')
 
-PARAMETER_HEADER_ORDER = [
+PARAMETER_HEADER_ORDER = (
     'name',
     'id',
     'nRate',
@@ -52,7 +59,11 @@ PARAMETER_HEADER_ORDER = [
     'reactive_pressure',
     'notes',
     'special',
-]
+)
+# Parameter table columns that set_param_cell_tooltip knows how to describe
+TOOLTIP_KEYS = frozenset(('nBeamClassRange', 'neVRange'))
+# How many state prefixes keep their monitors after the device is deselected
+STATE_DEVICE_CACHE_SIZE = 8
 
 
 class PMPSManagerGui(QMainWindow):
@@ -70,23 +81,43 @@ class PMPSManagerGui(QMainWindow):
     expert_dir : str, optional
         The directory that contains the exported database files.
     """
+    # Emitted from worker threads with the results of _list_download_files
+    download_list_ready = Signal(int, str, object)
+    # Emitted from worker threads with the results of _download_text
+    download_text_ready = Signal(int, str, str, object)
+    # Emitted from worker threads with the hostname from _upload_file
+    upload_done = Signal(str)
+
     def __init__(self, configs: list[str]):
         super().__init__()
         self.setWindowTitle('PMPSDB Client GUI')
         if not configs:
             configs = select_default_config()
-        self.plc_config = {}
-        for config in configs:
-            with open(config, 'r') as fd:
-                self.plc_config.update(yaml.full_load(fd))
+        # Later configs take priority, like sequential dict updates
+        self.plc_config = dict(
+            collections.ChainMap(*reversed([load_config(config) for config in configs]))
+        )
         self.plc_hostnames = list(self.plc_config)
         self.tables = SummaryTables(plc_config=self.plc_config)
         self.setCentralWidget(self.tables)
         self.setup_menu_options()
         self.setup_status_bar()
         self.device_map = None
+        # Used to ignore the results of cancelled or replaced downloads
+        self._download_id = 0
+        self._download_progress = None
+        self.download_list_ready.connect(self._select_download)
+        self.download_text_ready.connect(self._save_download)
+        self.upload_done.connect(self.tables.on_file_upload)
         logger.info('pmpsdb client gui loaded')
 
+    def closeEvent(self, event) -> None:
+        """
+        Stop the background work so it doesn't hold up exiting.
+        """
+        self.tables.shutdown()
+        super().closeEvent(event)
+
     def setup_menu_options(self):
         """
         Create entries and actions in the menu for all configured PLCs.
@@ -94,40 +125,28 @@ class PMPSManagerGui(QMainWindow):
         menu = self.menuBar()
 
         file_menu = menu.addMenu('&File')
-        upload_latest_menu = file_menu.addMenu('Upload &Latest to')
-        upload_menu = file_menu.addMenu('&Upload to')
-        download_menu = file_menu.addMenu('&Download from')
-        reload_menu = file_menu.addMenu('&Reload Params')
-        # Actions will be garbage collected if we drop this reference
+        # Each of these submenus has one action per PLC
+        plc_menus = (
+            ('Upload &Latest to', self.upload_latest),
+            ('&Upload to', self.upload_to),
+            ('&Download from', self.download_from),
+            ('&Reload Params', self.reload_params),
+        )
+        # The menus own their actions, this is just for easy access
         self.actions = []
-        for plc in self.plc_hostnames:
-            upload_latest_action = QAction()
-            upload_latest_action.setText(plc)
-            upload_latest_menu.addAction(upload_latest_action)
-            upload_action = QAction()
-            upload_action.setText(plc)
-            upload_menu.addAction(upload_action)
-            download_action = QAction(plc)
-            download_action.setText(plc)
-            download_menu.addAction(download_action)
-            reload_action = QAction(plc)
-            reload_action.setText(plc)
-            reload_menu.addAction(reload_action)
-            self.actions.append(upload_latest_action)
-            self.actions.append(upload_action)
-            self.actions.append(download_action)
-            self.actions.append(reload_action)
-        upload_latest_menu.triggered.connect(self.upload_latest)
-        upload_menu.triggered.connect(self.upload_to)
-        download_menu.triggered.connect(self.download_from)
-        reload_menu.triggered.connect(self.reload_params)
+        for title, slot in plc_menus:
+            plc_menu = file_menu.addMenu(title)
+            for plc in self.plc_hostnames:
+                action = plc_menu.addAction(plc)
+                # The slots read the hostname from data, the text is for display
+                action.setData(plc)
+                self.actions.append(action)
+            plc_menu.triggered.connect(slot)
 
         device_menu = menu.addMenu('&Device')
         find_plc_action = device_menu.addAction('&Find Device PLC')
         find_plc_action.triggered.connect(self.find_plc)
 
-        self.setMenuWidget(menu)
-
     def setup_status_bar(self) -> None:
         """
         Set up the status bar to show log messages INFO and higher.
@@ -144,7 +163,7 @@ class PMPSManagerGui(QMainWindow):
         """
         Upload the latest database export to a plc.
         """
-        hostname = action.text()
+        hostname = action.data()
 
         reply = QMessageBox.question(
             self,
@@ -163,24 +182,17 @@ class PMPSManagerGui(QMainWindow):
         except KeyError:
             logger.error('No exports found for plc %s', hostname)
             return
-        try:
-            upload_filename(
-                hostname=hostname,
-                filename=this_plc_latest.full_path,
-                dest_filename=this_plc_latest.get_plc_filename(),
-            )
-        except Exception:
-            logger.error('Failed to upload %s to %s', this_plc_latest.filename, hostname)
-            logger.debug('', exc_info=True)
-        else:
-            logger.info('Uploaded latest database file to %s', hostname)
-        self.tables.on_file_upload(hostname)
+        self.start_upload(
+            hostname=hostname,
+            filename=this_plc_latest.full_path,
+            dest_filename=this_plc_latest.get_plc_filename(),
+        )
 
     def upload_to(self, action: QAction) -> None:
         """
         Upload a file from the local filesystem to a plc.
         """
-        hostname = action.text()
+        hostname = action.data()
         logger.debug('%s upload action', hostname)
         # Show file browser on local host
         filename, _ = QFileDialog.getOpenFileName(
@@ -212,6 +224,31 @@ class PMPSManagerGui(QMainWindow):
         else:
             dest_filename = exported_file.get_plc_filename()
 
+        self.start_upload(
+            hostname=hostname,
+            filename=filename,
+            dest_filename=dest_filename,
+        )
+
+    def start_upload(self, hostname: str, filename: str, dest_filename: str) -> None:
+        """
+        Upload a file in the background, then refresh that PLC in the tables.
+        """
+        logger.info('Uploading %s to %s', os.path.basename(filename), hostname)
+        self.tables.run_in_background(
+            self.upload_done,
+            self._upload_file,
+            hostname,
+            filename,
+            dest_filename,
+            error_result=(hostname,),
+        )
+
+    @staticmethod
+    def _upload_file(hostname: str, filename: str, dest_filename: str) -> tuple[str]:
+        """
+        Upload a file to the PLC without making any Qt calls.
+        """
         logger.debug('Uploading %s to %s as %s', filename, hostname, dest_filename)
         try:
             upload_filename(
@@ -223,23 +260,103 @@ class PMPSManagerGui(QMainWindow):
             logger.error('Failed to upload %s to %s', filename, hostname)
             logger.debug('', exc_info=True)
         else:
-            logger.info('Uploaded file to %s', hostname)
-        self.tables.on_file_upload(hostname)
+            logger.info('Uploaded %s to %s', os.path.basename(filename), hostname)
+        return (hostname,)
 
     def download_from(self, action: QAction) -> None:
         """
         Download a file from a plc to the local filesystem.
+
+        The network calls run in the background with a progress dialog
+        up, see _select_download and _save_download for the next steps.
         """
-        hostname = action.text()
+        hostname = action.data()
         logger.debug('%s download action', hostname)
         # Check the available files
+        self._download_id += 1
+        self._show_download_progress(f'Reading files from {hostname}...')
+        self.tables.run_in_background(
+            self.download_list_ready,
+            self._list_download_files,
+            self._download_id,
+            hostname,
+            error_result=(self._download_id, hostname, None),
+        )
+
+    def _show_download_progress(self, text: str) -> None:
+        """
+        Show a busy dialog while we wait on the PLC, cancel drops the download.
+        """
+        if self._download_progress is None:
+            self._download_progress = QProgressDialog(self)
+            self._download_progress.setWindowTitle('Download')
+            self._download_progress.setRange(0, 0)
+            self._download_progress.setMinimumDuration(0)
+        # Clear a cancel from an older download that hasn't come back yet
+        self._download_progress.reset()
+        self._download_progress.setLabelText(text)
+        self._download_progress.show()
+
+    def _download_cancelled(self, download_id: int) -> bool:
+        """
+        Close the progress dialog and check if this download is still wanted.
+        """
+        if download_id != self._download_id:
+            return True
+        cancelled = self._download_progress.wasCanceled()
+        self._download_progress.reset()
+        return cancelled
+
+    @staticmethod
+    def _list_download_files(
+        download_id: int,
+        hostname: str,
+    ) -> tuple[int, str, Optional[list[str]]]:
+        """
+        Get the filenames on the PLC without making any Qt calls.
+
+        This usually reuses the listing from selecting the PLC row.
+        """
         try:
-            file_info = list_file_info(hostname=hostname)
+            file_info = list_file_info_cached(hostname=hostname)
         except Exception:
             logger.error('Unable to read files from %s', hostname)
             logger.debug('', exc_info=True)
+            return download_id, hostname, None
+        return download_id, hostname, [data.filename for data in file_info]
+
+    @staticmethod
+    def _download_text(
+        download_id: int,
+        hostname: str,
+        filename: str,
+    ) -> tuple[int, str, str, Optional[str]]:
+        """
+        Download a file from the PLC without making any Qt calls.
+        """
+        try:
+            text = download_file_text(
+                hostname=hostname,
+                filename=filename,
+            )
+        except Exception:
+            logger.error('Error downloading %s from %s', filename, hostname)
+            logger.debug('', exc_info=True)
+            return download_id, hostname, filename, None
+        return download_id, hostname, filename, text
+
+    def _select_download(
+        self,
+        download_id: int,
+        hostname: str,
+        filenames: Optional[list[str]],
+    ) -> None:
+        """
+        Let the user pick a file to download once we have the file list.
+        """
+        if self._download_cancelled(download_id) or filenames is None:
             return
-        if not file_info:
+        if not filenames:
             logger.error('No PMPS files on  %s', hostname)
             return
         # Show the user and let the user select one file
@@ -247,19 +364,33 @@ class PMPSManagerGui(QMainWindow):
             self,
             'Filenames',
             'Please select which file to download',
-            [data.filename for data in file_info],
+            filenames,
         )
         if not ok:
             return
         # Download the file
-        try:
-            text = download_file_text(
-                hostname=hostname,
-                filename=filename,
-            )
-        except Exception:
-            logger.error('Error downloading %s from %s', filename, hostname)
-            logger.debug('', exc_info=True)
+        self._download_id += 1
+        self._show_download_progress(f'Downloading {filename} from {hostname}...')
+        self.tables.run_in_background(
+            self.download_text_ready,
+            self._download_text,
+            self._download_id,
+            hostname,
+            filename,
+            error_result=(self._download_id, hostname, filename, None),
+        )
+
+    def _save_download(
+        self,
+        download_id: int,
+        hostname: str,
+        filename: str,
+        text: Optional[str],
+    ) -> None:
+        """
+        Let the user pick where to save a file once it is downloaded.
+        """
+        if self._download_cancelled(download_id) or text is None:
             return
         # Let the user select a place to save the file
         save_filename, _ = QFileDialog.getSaveFileName(
@@ -288,7 +419,7 @@ class PMPSManagerGui(QMainWindow):
         """
         Command a PLC to reload its PMPS parameters from the database file.
         """
-        hostname = action.text()
+        hostname = action.data()
         logger.debug('%s reload action', hostname)
         # Confirmation dialog, this is kind of bad to do accidentally
         reply = QMessageBox.question(
@@ -320,6 +451,24 @@ class PMPSManagerGui(QMainWindow):
         self.device_map.show()
 
 
+def load_config(path: str) -> dict[str, str]:
+    """
+    Load a plc name to IOC prefix configuration file.
+
+    The result is shared between calls until the file changes,
+    so callers should not modify it.
+    """
+    stat = os.stat(path)
+    return _load_config(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=100)
+def _load_config(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    # mtime_ns and size are only here to be part of the cache key
+    with open(path, 'r') as fd:
+        return yaml.load(fd, Loader=YamlLoader)
+
+
 def select_default_config() -> list[str]:
     """
     Select the most likely correct config based on the hostname.
@@ -476,13 +625,38 @@ class SummaryTables(DesignerDisplay, QWidget):
     }
     cached_db: dict[str: dict[str, dict[str, Any]]]
     param_dict: dict[str, dict[str, Any]]
+    device_lines: dict[str, Optional[str]]
     plc_row_map: dict[str, int]
     ok_rows: dict[int, bool]
     line: str
 
+    # Emitted from worker threads with the results of _gather_plc_status
+    plc_status_ready = Signal(int, str, str, bool, int)
+    # Emitted from worker threads with the results of _download_db
+    db_ready = Signal(str, object, object, int)
+    # Emitted from EPICS callbacks with a PLC's new last refresh timestamp
+    last_refresh_ready = Signal(str, float)
+    # Emitted from worker threads with the results of _read_ioc_params
+    ioc_params_ready = Signal(str, object, object)
+
     def __init__(self, plc_config: dict[str, str]):
         super().__init__()
         self.ok_rows = {}
+        self.cached_db = None
+        self._db_hostname = None
+        # PLC selected by the user that is waiting on its status check
+        self._selected_hostname = None
+        # Hostnames with status checks running in the background
+        self._probing = set()
+        self._plc_resize_pending = False
+        # hostname -> ((timestamp, size), db) from the last _download_db
+        # Only used from the GUI thread, workers get a copy of their entry
+        self._db_cache = {}
+        # hostname -> count of uploads, status checks and db downloads
+        # from before an upload are out of date
+        self._upload_generation = collections.Counter()
+        # Network calls run here so they don't block the GUI thread
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=16)
         self.db_controls = {
             name: PLCDBControls(prefix=prefix + ':', name=name)
             for name, prefix in plc_config.items()
@@ -490,15 +664,31 @@ class SummaryTables(DesignerDisplay, QWidget):
         self.setup_table_columns()
         self.plc_row_map = {}
         self.line = 'l'
+        self.device_lines = {}
+        # Device shown in the parameter tables, so old ioc reads can be dropped
+        self._ioc_device_name = None
+        # prefix -> AllStateBP, most recently used last, so their monitors
+        # stay subscribed while the user moves between a few devices
+        self.state_devices = collections.OrderedDict()
         self._test_mode = False
-        for hostname in plc_config:
+        # Size the table once and hold off on repaints until it is filled
+        self.plc_table.setUpdatesEnabled(False)
+        self.plc_table.setRowCount(len(plc_config))
+        for row, hostname in enumerate(plc_config):
             if '-tst-' in hostname:
                 self._test_mode = True
-            self.add_plc(hostname)
+            self.add_plc(hostname, row=row)
+        self.plc_table.setUpdatesEnabled(True)
         self.update_export_times()
         self.plc_table.resizeColumnsToContents()
         self.plc_table.cellActivated.connect(self.plc_selected)
         self.device_list.itemActivated.connect(self.device_selected)
+        self.plc_status_ready.connect(self._apply_plc_status)
+        self.db_ready.connect(self._apply_db)
+        self.last_refresh_ready.connect(self._apply_last_refresh)
+        self.ioc_params_ready.connect(self._apply_ioc_params)
+        self.subscribe_last_refresh()
+        self.update_all_plc_rows()
 
     def setup_table_columns(self) -> None:
         """
@@ -514,13 +704,20 @@ class SummaryTables(DesignerDisplay, QWidget):
         # Vertical (row) header skipped here: looks better without it
         self.clear_loaded_table()
 
-    def add_plc(self, hostname: str) -> None:
+    def add_plc(self, hostname: str, row: Optional[int] = None) -> None:
         """
         Add a PLC row to the table on the left.
+
+        This only creates the row, the network status checks are done
+        separately in update_all_plc_rows or start_plc_row_update.
+
+        If row is provided, fill an existing empty row instead of
+        inserting a new one at the end of the table.
         """
         logger.debug('add_plc(%s)', hostname)
-        row = self.plc_table.rowCount()
-        self.plc_table.insertRow(row)
+        if row is None:
+            row = self.plc_table.rowCount()
+            self.plc_table.insertRow(row)
         name_item = QTableWidgetItem(hostname)
         status_item = QTableWidgetItem()
         export_time_item = QTableWidgetItem()
@@ -531,64 +728,213 @@ class SummaryTables(DesignerDisplay, QWidget):
         self.plc_table.setItem(row, PLCTableColumns.EXPORT, export_time_item)
         self.plc_table.setItem(row, PLCTableColumns.UPLOAD, upload_time_item)
         self.plc_table.setItem(row, PLCTableColumns.RELOAD, param_load_time)
-        self.update_plc_row(row, update_export=False)
         self.plc_row_map[hostname] = row
-
-        def on_refresh(value, **kwargs):
-            param_load_time.setText(
-                datetime.datetime.fromtimestamp(value).ctime()
-            )
-
+        # Until the first update from subscribe_last_refresh
         last_refresh_signal = self.db_controls[hostname].last_refresh
         param_load_time.setText(f'No connect: {last_refresh_signal.pvname}')
-        last_refresh_signal.subscribe(on_refresh)
 
-    def update_plc_row(self, row: int, update_export: bool = True) -> None:
+    def subscribe_last_refresh(self) -> None:
+        """
+        Subscribe to every PLC's last refresh PV in one pass.
+
+        Doing this after all the rows exist starts all of the PV searches
+        together. The callbacks run in an EPICS thread, so they only pass
+        the values along to _apply_last_refresh through a signal.
+        """
+        for hostname, controls in self.db_controls.items():
+
+            def on_refresh(value, hostname=hostname, **kwargs):
+                self.last_refresh_ready.emit(hostname, value)
+
+            controls.last_refresh.subscribe(on_refresh)
+
+    def _apply_last_refresh(self, hostname: str, value: float) -> None:
+        """
+        Show a new last refresh time in the PLC table.
+
+        This must be run in the GUI thread.
+        """
+        item = self.plc_table.item(self.plc_row_map[hostname], PLCTableColumns.RELOAD)
+        item.setText(format_timestamp(value))
+
+    def update_all_plc_rows(self) -> None:
+        """
+        Update the status information in the PLC table for every row.
+
+        The network checks for each PLC are run concurrently in a thread pool
+        so that the total wait is set by the slowest PLC rather than the sum
+        of all of them. The results are sent back to the GUI thread through
+        the plc_status_ready signal.
+        """
+        for row in self.plc_row_map.values():
+            for column in (PLCTableColumns.STATUS, PLCTableColumns.UPLOAD):
+                self.plc_table.item(row, column).setText('Probing...')
+            self.start_plc_row_update(row)
+
+    def start_plc_row_update(self, row: int) -> None:
         """
-        Update the status information in the PLC table for one row.
+        Update the status information for one row in the background.
 
-        This is limited to the file read actions. We'll do this once on
-        startup and again when the row is selected.
-        Data source from PVs will be updated on monitor outside the scope
-        of this method.
+        If this PLC is already being checked, we wait for that result
+        instead of starting another one.
         """
-        logger.debug('update_plc_row(%d)', row)
         hostname = self.plc_table.item(row, PLCTableColumns.NAME).text()
-        logger.debug('row %d is %s', row, hostname)
+        if hostname in self._probing:
+            logger.debug('Already checking %s', hostname)
+            return
+        self._probing.add(hostname)
+        self.run_in_background(
+            self.plc_status_ready,
+            self._gather_plc_status,
+            row,
+            hostname,
+            self._upload_generation[hostname],
+            error_result=(
+                row, 'error', 'Status check failed', False,
+                self._upload_generation[hostname],
+            ),
+        )
+
+    def run_in_background(
+        self,
+        signal: Signal,
+        func,
+        *args,
+        error_result: Optional[tuple] = None,
+    ) -> None:
+        """
+        Run func(*args) in a worker thread and emit signal with the result.
+
+        func must return a tuple of the signal's arguments and must not
+        make any Qt calls. The signal is what brings the result back to
+        the GUI thread.
+
+        If func raises, the error is logged and signal is emitted with
+        error_result instead, so the GUI doesn't wait forever on a result.
+        """
+        try:
+            future = self._executor.submit(func, *args)
+        except RuntimeError:
+            # The executor was shut down, the window is closing
+            logger.debug('Not running %s after shutdown', func)
+            return
+
+        def emit_result(future: concurrent.futures.Future) -> None:
+            if future.cancelled():
+                return
+            try:
+                result = future.result()
+            except Exception:
+                logger.warning('Error in background call to %s', func.__name__, exc_info=True)
+                if error_result is None:
+                    return
+                result = error_result
+            signal.emit(*result)
+
+        future.add_done_callback(emit_result)
+
+    def shutdown(self) -> None:
+        """
+        Stop the background work, for when the window is closed.
+
+        Calls that are already running can't be interrupted, but anything
+        still waiting in the queue is dropped.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _gather_plc_status(
+        self,
+        row: int,
+        hostname: str,
+        generation: int,
+    ) -> tuple[int, str, str, bool, int]:
+        """
+        Do the network checks needed to update one row of the PLC table.
+
+        This makes no Qt calls and is safe to run in a worker thread.
+
+        Returns
+        -------
+        row, status_text, upload_text, ok, generation : tuple
+            The table row, the text for the status and upload columns,
+            whether or not we were able to read the file list,
+            and the upload generation we were given.
+        """
         if check_server_online(hostname):
-            text = 'online'
+            status_text = 'online'
         else:
-            text = 'offline'
-        self.plc_table.item(row, PLCTableColumns.STATUS).setText(text)
+            status_text = 'offline'
         info = []
         try:
-            info = list_file_info(hostname)
+            info = list_file_info_cached(hostname)
         except Exception as exc:
             logger.error('Error reading file list from %s: %s', hostname, exc)
             logger.debug('list_file_info(%s) failed', hostname, exc_info=True)
             text = str(exc)
-            if '] ' in text and text.startswith('[Errno'):
-                text = text.split('] ')[1]
-            text = text.capitalize()
-            self.ok_rows[row] = False
+            # Drop the "[Errno N] " prefix from OSError messages
+            match = ERRNO_RE.match(text)
+            if match is not None:
+                text = match.group(1)
+            upload_text = text.capitalize()
+            ok = False
         else:
             logger.debug('%s found file info %s', hostname, info)
-            text = 'No upload found'
-            self.ok_rows[row] = True
+            upload_text = 'No upload found'
+            ok = True
         filename = hostname_to_filename(hostname)
         for file_info in info:
             if file_info.filename == filename:
-                text = file_info.last_changed.ctime()
+                upload_text = file_info.last_changed.ctime()
                 break
-        self.plc_table.item(row, PLCTableColumns.UPLOAD).setText(text)
-        if update_export:
-            self.update_export_times()
+        return row, status_text, upload_text, ok, generation
 
-    def update_plc_row_by_hostname(self, hostname: str) -> None:
+    def _apply_plc_status(
+        self,
+        row: int,
+        status_text: str,
+        upload_text: str,
+        ok: bool,
+        generation: int,
+    ) -> None:
         """
-        Update the status information in the PLC table for one hostname.
+        Write the results from _gather_plc_status into the PLC table.
+
+        This must be run in the GUI thread.
+        If the user selected this PLC while we were checking it,
+        this also starts the database download.
+        Results from checks that started before an upload are dropped,
+        on_file_upload starts a new check.
+        """
+        hostname = self.plc_table.item(row, PLCTableColumns.NAME).text()
+        if generation != self._upload_generation[hostname]:
+            logger.debug('Dropping %s status from before an upload', hostname)
+            return
+        try:
+            self.plc_table.item(row, PLCTableColumns.STATUS).setText(status_text)
+            self.plc_table.item(row, PLCTableColumns.UPLOAD).setText(upload_text)
+            self.ok_rows[row] = ok
+            self.schedule_plc_table_resize()
+        finally:
+            self._probing.discard(hostname)
+        if hostname == self._selected_hostname:
+            self._selected_hostname = None
+            if ok:
+                self.start_db_download(hostname)
+
+    def schedule_plc_table_resize(self) -> None:
+        """
+        Resize the PLC table columns once the current burst of updates is done.
+
+        At startup every PLC's status check finishes at about the same time,
+        so this does one resize for all of them instead of one each.
         """
-        return self.update_plc_row(self.plc_row_map[hostname])
+        if not self._plc_resize_pending:
+            self._plc_resize_pending = True
+            QTimer.singleShot(0, self._resize_plc_table)
+
+    def _resize_plc_table(self) -> None:
+        self._plc_resize_pending = False
+        self.plc_table.resizeColumnsToContents()
 
     def update_export_times(self) -> None:
         """
@@ -605,20 +951,70 @@ class SummaryTables(DesignerDisplay, QWidget):
             else:
                 export_item.setText(plc_export.export_time.ctime())
 
-    def get_cached_db(self, hostname: str) -> bool:
+    def start_db_download(self, hostname: str) -> None:
         """
-        Download and cache the full contents of the database file.
+        Download the database file in the background.
 
-        Returns True if successful and False otherwise.
+        The loaded table and device list are filled in by _apply_db
+        once the download finishes.
         """
         self.cached_db = None
+        self._db_hostname = hostname
+        loading_item = QListWidgetItem('Loading...')
+        loading_item.setFlags(Qt.NoItemFlags)
+        self.device_list.clear()
+        self.device_list.addItem(loading_item)
+        self.run_in_background(
+            self.db_ready,
+            self._download_db,
+            hostname,
+            self._db_cache.get(hostname),
+            self._upload_generation[hostname],
+            error_result=(hostname, None, None, self._upload_generation[hostname]),
+        )
+
+    @staticmethod
+    def _download_db(
+        hostname: str,
+        cached: Optional[tuple[tuple, dict[str, Any]]] = None,
+        generation: int = 0,
+    ) -> tuple[str, Optional[dict[str, Any]], Optional[tuple], int]:
+        """
+        Download the full contents of the database file.
+
+        This makes no Qt calls and is safe to run in a worker thread.
+
+        Parameters
+        ----------
+        hostname : str
+            The PLC to download from.
+        cached : tuple, optional
+            The (fingerprint, db) cache entry for this PLC, if there is one.
+            This is reused if the file on the PLC hasn't changed.
+        generation : int, optional
+            The upload count for this PLC when the download started,
+            passed through to _cache_db.
+
+        Returns
+        -------
+        hostname, db, fingerprint, generation : tuple
+            The hostname we downloaded from, the database contents or None
+            if the download failed, the file's fingerprint if known,
+            and the generation we were given.
+        """
         filename = hostname_to_filename(hostname)
+        fingerprint = SummaryTables._db_fingerprint(hostname, filename)
+        if cached is not None:
+            cached_fingerprint, cached_db = cached
+            if fingerprint is not None and fingerprint == cached_fingerprint:
+                logger.debug('%s db file unchanged, using cached db', hostname)
+                return hostname, cached_db, fingerprint, generation
         try:
-            self.cached_db = download_file_json_dict(
+            db = download_file_json_dict(
                 hostname=hostname,
                 filename=filename,
             )
-            logger.debug('%s found db info %s', hostname, self.cached_db)
+            logger.debug('%s found db info %s', hostname, db)
         except Exception:
             logger.error(
                 'Could not download %s from %s',
@@ -631,8 +1027,69 @@ class SummaryTables(DesignerDisplay, QWidget):
                 filename,
                 exc_info=True,
             )
-            return False
-        return True
+            return hostname, None, fingerprint, generation
+        return hostname, db, fingerprint, generation
+
+    def _cache_db(
+        self,
+        hostname: str,
+        db: Optional[dict[str, Any]],
+        fingerprint: Optional[tuple],
+        generation: int,
+    ) -> None:
+        """
+        Keep a downloaded db for next time, unless it is out of date.
+
+        This must be run in the GUI thread.
+        A download that started before an upload finished may have the old
+        file, and the fingerprint can't always tell, so we drop it.
+        """
+        if db is None or fingerprint is None:
+            return
+        if generation != self._upload_generation[hostname]:
+            logger.debug('%s db download predates an upload, not caching', hostname)
+            return
+        self._db_cache[hostname] = (fingerprint, db)
+
+    @staticmethod
+    def _db_fingerprint(hostname: str, filename: str) -> Optional[tuple]:
+        """
+        Get the timestamp and size of the database file on the PLC, if we can.
+
+        This uses the recent file info from the PLC status checks,
+        so it does not usually need another network call.
+        """
+        try:
+            file_info = list_file_info_cached(hostname)
+        except Exception:
+            return None
+        for info in file_info:
+            if info.filename == filename:
+                return info.last_changed, info.size
+        return None
+
+    def _apply_db(
+        self,
+        hostname: str,
+        db: Optional[dict[str, Any]],
+        fingerprint: Optional[tuple],
+        generation: int,
+    ) -> None:
+        """
+        Use the results from _download_db to fill the loaded table and device list.
+
+        This must be run in the GUI thread.
+        """
+        self._cache_db(hostname, db, fingerprint, generation)
+        if hostname != self._db_hostname:
+            # The user selected a different PLC while this was downloading
+            return
+        self.device_list.clear()
+        if db is None:
+            return
+        self.cached_db = db
+        self.fill_loaded_table(hostname)
+        self.fill_device_list(hostname)
 
     def clear_loaded_table(self) -> None:
         """
@@ -655,7 +1112,7 @@ class SummaryTables(DesignerDisplay, QWidget):
         """
         Assemble information for the "loaded" table.
 
-        Requires a valid cached database from get_cached_db
+        Requires a valid cached database, see start_db_download and _apply_db.
         """
         self.clear_loaded_table()
         self.loaded_table.setCellWidget(
@@ -735,7 +1192,7 @@ class SummaryTables(DesignerDisplay, QWidget):
         """
         Populate the device list.
 
-        Requires a valid cached database from get_cached_db
+        Requires a valid cached database, see start_db_download and _apply_db.
         """
         self.device_list.clear()
         self.param_table.clear()
@@ -745,8 +1202,10 @@ class SummaryTables(DesignerDisplay, QWidget):
         except KeyError:
             logger.error('Did not find required entry %s', key)
             return
+        self.device_lines = {}
         for device_name in self.param_dict:
             self.device_list.addItem(device_name)
+            self.device_lines[device_name] = device_line(device_name)
         logger.info(
             'Found %d devices in %s local database',
             len(self.param_dict),
@@ -760,12 +1219,9 @@ class SummaryTables(DesignerDisplay, QWidget):
         self.param_table.clear()
         self.param_table.setRowCount(0)
         self.param_table.setColumnCount(0)
-        prefix = device_name.lower().split('-')[0]
-        # Find the last letter in prefix
-        for char in reversed(prefix):
-            if char in ('l', 'k'):
-                self.line = char
-                break
+        line = self.device_lines.get(device_name)
+        if line is not None:
+            self.line = line
         try:
             device_params = self.param_dict[device_name]
         except KeyError:
@@ -778,11 +1234,9 @@ class SummaryTables(DesignerDisplay, QWidget):
             return
 
         # Lock in the header
-        header_from_file = list(list(device_params.values())[0])
-        header = copy.copy(PARAMETER_HEADER_ORDER)
-        for elem in header_from_file:
-            if elem not in header:
-                header.append(elem)
+        header_from_file = next(iter(device_params.values()))
+        # Standard columns first, then any extras from the file, in order
+        header = list(dict.fromkeys([*PARAMETER_HEADER_ORDER, *header_from_file]))
         self.param_table.setColumnCount(len(header))
         self.param_table.setHorizontalHeaderLabels(header)
         self._fill_params(
@@ -796,12 +1250,34 @@ class SummaryTables(DesignerDisplay, QWidget):
             device_name,
         )
 
-        self.ioc_table.clear()
-        self.ioc_table.setRowCount(0)
-        self.ioc_table.setColumnCount(0)
-
+        self._ioc_device_name = device_name
+        self._show_ioc_message('Loading...')
         prefixes = self.get_states_prefixes(device_name)
-        all_states = [AllStateBP(prefix, name=prefix) for prefix in prefixes]
+        all_states = [self.get_state_device(prefix) for prefix in prefixes]
+        self.run_in_background(
+            self.ioc_params_ready,
+            self._read_ioc_params,
+            device_name,
+            all_states,
+            error_result=(device_name, None, 'Error reading from the IOC'),
+        )
+
+    @staticmethod
+    def _read_ioc_params(
+        device_name: str,
+        all_states: list[AllStateBP],
+    ) -> tuple[str, Optional[dict[str, dict[str, Any]]], Optional[str]]:
+        """
+        Read the state parameters from the IOC.
+
+        This makes no Qt calls and is safe to run in a worker thread.
+
+        Returns
+        -------
+        device_name, ioc_params, error : tuple
+            The device we read, the parameters or None on a timeout,
+            and the timeout message to show in the table.
+        """
         ioc_params = {}
         for states in all_states:
             try:
@@ -810,13 +1286,44 @@ class SummaryTables(DesignerDisplay, QWidget):
                 logger.error('Did not find values for device %s in ioc', device_name)
                 logger.debug('', exc_info=True)
                 # Get an example PV that didn't connect for the table
-                self.ioc_table.setColumnCount(1)
-                self.ioc_table.setRowCount(1)
-                self.ioc_table.setHorizontalHeaderLabels([''])
-                self.ioc_table.setItem(0, 0, QTableWidgetItem(str(exc)))
-                return
+                return device_name, None, str(exc)
+        return device_name, ioc_params, None
+
+    def _show_ioc_message(self, text: str) -> None:
+        """
+        Replace the ioc table contents with a single message.
+        """
+        self.ioc_table.clear()
+        self.ioc_table.setColumnCount(1)
+        self.ioc_table.setRowCount(1)
+        self.ioc_table.setHorizontalHeaderLabels([''])
+        self.ioc_table.setItem(0, 0, QTableWidgetItem(text))
 
-        ioc_header = list(list(ioc_params.values())[0])
+    def _apply_ioc_params(
+        self,
+        device_name: str,
+        ioc_params: Optional[dict[str, dict[str, Any]]],
+        error: Optional[str],
+    ) -> None:
+        """
+        Use the results from _read_ioc_params to fill the ioc table.
+
+        This must be run in the GUI thread.
+        """
+        if device_name != self._ioc_device_name:
+            # The user selected a different device while this was reading
+            return
+        if ioc_params is None:
+            self._show_ioc_message(error)
+            return
+        self.ioc_table.clear()
+        self.ioc_table.setRowCount(0)
+        self.ioc_table.setColumnCount(0)
+        if not ioc_params:
+            logger.info('Found no states for %s in IOC', device_name)
+            return
+
+        ioc_header = list(next(iter(ioc_params.values())))
         self.ioc_table.setColumnCount(len(ioc_header))
         self.ioc_table.setHorizontalHeaderLabels(ioc_header)
 
@@ -832,17 +1339,50 @@ class SummaryTables(DesignerDisplay, QWidget):
         )
 
     def _fill_params(self, table, header, params) -> None:
-        for state_info in params.values():
-            row = table.rowCount()
-            table.insertRow(row)
-            for key, value in state_info.items():
-                col = header.index(key)
-                value = str(value)
-                item = QTableWidgetItem(value)
-                self.set_param_cell_tooltip(item, key, value)
-                table.setItem(row, col, item)
+        header_index = {key: col for col, key in enumerate(header)}
+        # Size the table once and hold off on repaints until it is filled.
+        # Sorting is paused too, or items would move while we place them.
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        table.setRowCount(len(params))
+        try:
+            for row, state_info in enumerate(params.values()):
+                for key, value in state_info.items():
+                    col = header_index[key]
+                    if not isinstance(value, str):
+                        value = str(value)
+                    item = QTableWidgetItem(value)
+                    if key in TOOLTIP_KEYS:
+                        self.set_param_cell_tooltip(item, key, value)
+                    table.setItem(row, col, item)
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
         table.resizeColumnsToContents()
 
+    def get_state_device(self, prefix: str) -> AllStateBP:
+        """
+        Get the state beam parameters device for prefix, reusing old ones.
+
+        Reused devices keep their monitors, so reading them again is fast.
+        Only the last STATE_DEVICE_CACHE_SIZE prefixes are kept,
+        older devices are destroyed to drop their monitors.
+        """
+        try:
+            self.state_devices.move_to_end(prefix)
+            return self.state_devices[prefix]
+        except KeyError:
+            device = AllStateBP(prefix, name=prefix)
+            self.state_devices[prefix] = device
+        while len(self.state_devices) > STATE_DEVICE_CACHE_SIZE:
+            _, old_device = self.state_devices.popitem(last=False)
+            logger.debug('Dropping monitors for %s', old_device.prefix)
+            old_device.destroy()
+        return device
+
     def get_states_prefixes(self, device_name: str) -> list[str]:
         """
         Get the PV prefixes that corresponds to the device name.
@@ -870,15 +1410,9 @@ class SummaryTables(DesignerDisplay, QWidget):
         Set a tooltip to help out with a single cell in the parameters table.
         """
         if key == 'nBeamClassRange':
-            bitmask = int(value, base=2)
-            text = summarize_beam_class_bitmask(bitmask)
+            text = beam_class_tooltip(int(value, base=2))
         elif key == 'neVRange':
-            bitmask = int(value, base=2)
-            lines = get_bitmask_desc(
-                bitmask=bitmask,
-                line=self.line,
-            )
-            text = '\n'.join(lines)
+            text = photon_energy_tooltip(int(value, base=2), self.line)
         else:
             # Have not handled this case yet
             return
@@ -898,11 +1432,11 @@ class SummaryTables(DesignerDisplay, QWidget):
         self.ioc_table.setColumnCount(0)
         self.clear_loaded_table()
         self.device_list.clear()
-        self.update_plc_row(row)
-        if self.ok_rows.get(row, False):
-            if self.get_cached_db(hostname):
-                self.fill_loaded_table(hostname)
-                self.fill_device_list(hostname)
+        self._db_hostname = None
+        # The db download starts in _apply_plc_status if the PLC is ok
+        self._selected_hostname = hostname
+        self.start_plc_row_update(row)
+        self.update_export_times()
 
     def device_selected(self, item: QListWidgetItem) -> None:
         """
@@ -918,6 +1452,11 @@ class SummaryTables(DesignerDisplay, QWidget):
         This will select the corresponding PLC in the GUI in order to reload and
         show the pertinent information for that PLC.
         """
+        # ftp timestamps are only to the minute, don't trust the cached db
+        self._db_cache.pop(hostname, None)
+        self._upload_generation[hostname] += 1
+        # Any check still running is from before the upload, start a new one
+        self._probing.discard(hostname)
         for plc_row in range(self.plc_table.rowCount()):
             if self.plc_table.item(plc_row, PLCTableColumns.NAME).text() == hostname:
                 # Visual selection, doesn't "activate" (double-click) the cell
@@ -930,6 +1469,9 @@ class SummaryTables(DesignerDisplay, QWidget):
 class StatusBarHandler(logging.Handler):
     """
     Logging handler for sending log messages to a QStatusBar.
+
+    Log messages may come from worker threads, so the widget updates are
+    passed through a signal to be run in the GUI thread.
     """
     colors = {
         logging.CRITICAL: "crimson",
@@ -941,33 +1483,96 @@ class StatusBarHandler(logging.Handler):
 
     def __init__(self, status_bar: QStatusBar, level: int = logging.NOTSET) -> None:
         super().__init__(level=level)
+        self.relay = StatusBarRelay(status_bar)
+
+    def emit(self, record: logging.LogRecord):
+        self.relay.message.emit(
+            self.format(record),
+            self.colors.get(record.levelno, 'black'),
+        )
+
+
+class StatusBarRelay(QObject):
+    """
+    Helper for StatusBarHandler to show messages from any thread.
+    """
+    message = Signal(str, str)
+
+    def __init__(self, status_bar: QStatusBar) -> None:
+        super().__init__()
         self.status_bar = status_bar
         self.label = None
+        self.message.connect(self.show_message)
 
-    def emit(self, record: logging.LogRecord):
+    def show_message(self, text: str, color: str) -> None:
         if self.label is not None:
             self.status_bar.removeWidget(self.label)
-        self.label = QLabel(self.format(record))
+        self.label = QLabel(text)
         self.label.setIndent(10)
-        self.label.setStyleSheet(
-            f"QLabel {{ color: {self.colors.get(record.levelno, 'black')} }}"
-        )
+        self.label.setStyleSheet(f"QLabel {{ color: {color} }}")
         self.status_bar.addWidget(self.label)
 
 
-def check_server_online(hostname: str) -> bool:
+def check_server_online(
+    hostname: str,
+    ports: tuple[int, ...] = (22, 21),
+    timeout: float = 0.3,
+) -> bool:
     """
-    Ping a hostname to determine if it is network accessible or not.
+    Check if a hostname is network accessible on one of our transfer ports.
+
+    The PLCs are reached over either ssh (port 22) or ftp (port 21),
+    so we count the PLC as online if either of these accepts a connection.
+    The PLCs are on the local network, so each attempt gets a short timeout.
     """
-    try:
-        subprocess.run(
-            ['ping', '-c', '1', hostname],
-            capture_output=True,
-        )
-        return True
-    except Exception:
-        logger.debug('%s ping failed', hostname, exc_info=True)
-        return False
+    for port in ports:
+        try:
+            with socket.create_connection((hostname, port), timeout=timeout):
+                return True
+        except OSError:
+            logger.debug('%s port %d connect failed', hostname, port, exc_info=True)
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def format_timestamp(timestamp: float) -> str:
+    """
+    Readable text for a PV timestamp, cached since monitors often repeat values.
+    """
+    return datetime.datetime.fromtimestamp(timestamp).ctime()
+
+
+@functools.lru_cache(maxsize=256)
+def beam_class_tooltip(bitmask: int) -> str:
+    """
+    Describe a beam class bitmask, cached because most states share a few masks.
+    """
+    from .beam_class import summarize_beam_class_bitmask
+    return summarize_beam_class_bitmask(bitmask)
+
+
+@functools.lru_cache(maxsize=256)
+def photon_energy_tooltip(bitmask: int, line: str) -> str:
+    """
+    Describe a photon energy range bitmask, cached like beam_class_tooltip.
+    """
+    # pcdscalc is slow to import, wait until we need it
+    from pcdscalc.pmps import get_bitmask_desc
+    return '\n'.join(get_bitmask_desc(bitmask=bitmask, line=line))
+
+
+def device_line(device_name: str) -> Optional[str]:
+    """
+    Pick the beamline, 'l' or 'k', from the prefix of a device name.
+
+    Returns None if the prefix doesn't say.
+    """
+    prefix = device_name.lower().split('-')[0]
+    # Find the last letter in prefix
+    for char in reversed(prefix):
+        if char in ('l', 'k'):
+            return char
+    return None
 
 
 def hostname_to_key(hostname: str) -> str:
@@ -4,8 +4,13 @@ Module to define the EPICS interface to live PLC statuses.
 This contains ophyd device definitions that will be useful
 for checking the status or asking for a refresh.
 
+The beam parameter signals use auto_monitor, so once a device is connected
+repeated reads come from the latest monitor update instead of a new
+network request.
+
 In the future this may be reworked to use PyDM channels.
 """
+import functools
 import logging
 from typing import Any
 
@@ -48,11 +53,13 @@ class ApertureSize(Device):
     width = Cpt(
         EpicsSignalRO,
         'Width_RBV',
+        auto_monitor=True,
         doc='The horizontal aperture opening size.',
     )
     height = Cpt(
         EpicsSignalRO,
         'Height_RBV',
+        auto_monitor=True,
         doc='The vertical aperture opening size.',
     )
 
@@ -77,21 +84,25 @@ class BeamParameters(Device):
     nRate = Cpt(
         EpicsSignalRO,
         'Rate_RBV',
+        auto_monitor=True,
         doc='Rate limit with NC beam.',
     )
     nBeamClassRange = Cpt(
         EpicsSignalRO,
         'BeamClassRanges_RBV',
+        auto_monitor=True,
         doc='Acceptable beam parameters with SC Beam.',
     )
     neVRange = Cpt(
         EpicsSignalRO,
         'eVRanges_RBV',
+        auto_monitor=True,
         doc='Acceptable photon energies.',
     )
     nTran = Cpt(
         EpicsSignalRO,
         'Transmission_RBV',
+        auto_monitor=True,
         doc='Gas attenuator transmission limit.',
     )
     aperture1 = Cpt(
@@ -148,17 +159,20 @@ class DatabaseBeamParameters(Device):
     loaded = Cpt(
         EpicsSignalRO,
         'PMPS_LOADED_RBV',
+        auto_monitor=True,
         doc='True if the DB has been loaded for this state.',
     )
     db_name = Cpt(
         EpicsSignalRO,
         'PMPS_STATE_RBV',
+        auto_monitor=True,
         string=True,
         doc='Lookup key for this state.',
     )
     db_id = Cpt(
         EpicsSignalRO,
         'PMPS_ID_RBV',
+        auto_monitor=True,
         doc='Database and assertion id for this state.',
     )
     beam_parameters = Cpt(
@@ -196,12 +210,14 @@ class StateBeamParameters(Device):
     ctrl_name = Cpt(
         EpicsSignalRO,
         'NAME_RBV',
+        auto_monitor=True,
         string=True,
         doc='The short name you select in a control gui.',
     )
     ctrl_setpoint = Cpt(
         EpicsSignalRO,
         'SETPOINT_RBV',
+        auto_monitor=True,
         doc='The physical position in a control gui.',
     )
     database = Cpt(
@@ -246,6 +262,13 @@ class AllStateBP(Device):
     state_15 = Cpt(StateBeamParameters, '15:')
     transition = Cpt(DatabaseBeamParameters, 'PMPS:TRANS:')
 
+    @functools.cached_property
+    def states(self) -> tuple[StateBeamParameters, ...]:
+        """
+        The 15 state components, in order.
+        """
+        return tuple(getattr(self, f'state_{num:02}') for num in range(1, 16))
+
     def get_table_data(self) -> dict[str, dict[str, Any]]:
         """
         Create a dict that looks like what we get from the database.
@@ -253,8 +276,7 @@ class AllStateBP(Device):
         This will be a mapping from lookup key to value mapping.
         """
         data = {}
-        for num in range(1, 16):
-            state_bp: StateBeamParameters = getattr(self, f'state_{num:02}')
+        for num, state_bp in enumerate(self.states, start=1):
             try:
                 state_data = state_bp.get_table_data()
             except Exception:
@@ -287,9 +309,4 @@ def clean_bitmask(bitmask: int, width: int) -> str:
     - display as string
     - zero pad
     """
-    if bitmask < 0:
-        bitmask += 2**width
-    bitmask = bin(bitmask)[2:]
-    while len(bitmask) < width:
-        bitmask = '0' + bitmask
-    return bitmask
+    return format(bitmask & ((1 << width) - 1), f'0{width}b')
@@ -7,16 +7,29 @@ should work for getting data from the PLC.
 """
 from __future__ import annotations
 
+import collections
 import enum
-import json
+import io
 import logging
-from typing import Any
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable
 
 from . import ftp_data, ssh_data
 from .data_types import FileInfo
 
+try:
+    # Optional, parses the large PLC json files much faster
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 plc_mapping: dict[str, DataMethod] = {}
+file_info_cache: dict[tuple[str, str | None], tuple[float, list[FileInfo]]] = {}
+# hostname -> number of times the cache was cleared, to spot stale listings
+file_info_generation: collections.Counter[str] = collections.Counter()
+FILE_INFO_TTL = 5.0
 
 
 class DataMethod(enum.Enum):
@@ -92,6 +105,65 @@ def list_file_info(
         raise RuntimeError(f"Unhandled data method {data_method}")
 
 
+def list_file_info_cached(
+    hostname: str,
+    directory: str | None = None,
+    ttl: float = FILE_INFO_TTL,
+) -> list[FileInfo]:
+    """
+    Get information about the files on the PLC, reusing recent results.
+
+    This is the same as list_file_info, except that results from the last
+    ttl seconds are returned from memory instead of asking the PLC again.
+    The cache for a PLC is cleared when we upload a file to it.
+    A listing that started before the cache was cleared is returned but
+    not cached, since it may be from before the upload.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to check.
+    directory : str, optional
+        The diretory to read and write from.
+        A default directory is used if this argument is omitted,
+        which depends on the PLC OS.
+    ttl : float, optional
+        The maximum age in seconds of a cached result.
+
+    Returns
+    -------
+    filenames : list of FileInfo
+        Information about all the files in the PLC's pmps folder.
+    """
+    try:
+        timestamp, file_info = file_info_cache[(hostname, directory)]
+    except KeyError:
+        pass
+    else:
+        if time.monotonic() - timestamp < ttl:
+            logger.debug('Using cached file info for %s', hostname)
+            return file_info
+    generation = file_info_generation[hostname]
+    file_info = list_file_info(hostname=hostname, directory=directory)
+    if generation == file_info_generation[hostname]:
+        file_info_cache[(hostname, directory)] = (time.monotonic(), file_info)
+    else:
+        logger.debug('Not caching file info for %s, it was cleared meanwhile', hostname)
+    return file_info
+
+
+def clear_file_info_cache(hostname: str) -> None:
+    """
+    Forget the cached file information for one PLC.
+
+    Listings that are still in progress will not be cached either.
+    """
+    file_info_generation[hostname] += 1
+    for key in list(file_info_cache):
+        if key[0] == hostname:
+            file_info_cache.pop(key, None)
+
+
 def upload_filename(
     hostname: str,
     filename: str,
@@ -115,22 +187,74 @@ def upload_filename(
         which depends on the PLC OS.
     """
     data_method = get_data_method(hostname=hostname, directory=directory)
-    if data_method == DataMethod.ssh:
-        return ssh_data.upload_filename(
-            hostname=hostname,
-            filename=filename,
-            dest_filename=dest_filename,
-            directory=directory,
-        )
-    elif data_method == DataMethod.ftp:
-        return ftp_data.upload_filename(
-            hostname=hostname,
-            filename=filename,
-            dest_filename=dest_filename,
-            directory=directory,
-        )
-    else:
-        raise RuntimeError(f"Unhandled data method {data_method}")
+    try:
+        if data_method == DataMethod.ssh:
+            return ssh_data.upload_filename(
+                hostname=hostname,
+                filename=filename,
+                dest_filename=dest_filename,
+                directory=directory,
+            )
+        elif data_method == DataMethod.ftp:
+            return ftp_data.upload_filename(
+                hostname=hostname,
+                filename=filename,
+                dest_filename=dest_filename,
+                directory=directory,
+            )
+        else:
+            raise RuntimeError(f"Unhandled data method {data_method}")
+    finally:
+        # Whatever happens, the cached file info may be out of date now.
+        # Clear after the transfer so a background probe that ran during
+        # the upload can't leave stale info behind.
+        clear_file_info_cache(hostname)
+
+
+def upload_filenames(
+    hostname: str,
+    filenames: Iterable[str],
+    directory: str | None = None,
+) -> None:
+    """
+    Upload many files on your filesystem to a PLC.
+
+    Each file keeps its base name on the PLC.
+    Over ssh this is one tar transfer, over ftp the files go one at a time.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to upload to.
+    filenames : iterable of str
+        The names of the files on your filesystem.
+    directory : str, optional
+        The subdirectory to read and write from
+        A default directory is used if this argument is omitted,
+        which depends on the PLC OS.
+    """
+    filenames = list(filenames)
+    data_method = get_data_method(hostname=hostname, directory=directory)
+    try:
+        if data_method == DataMethod.ssh:
+            return ssh_data.upload_filenames(
+                hostname=hostname,
+                filenames=filenames,
+                directory=directory,
+            )
+        elif data_method == DataMethod.ftp:
+            for filename in filenames:
+                ftp_data.upload_filename(
+                    hostname=hostname,
+                    filename=filename,
+                    dest_filename=Path(filename).name,
+                    directory=directory,
+                )
+        else:
+            raise RuntimeError(f"Unhandled data method {data_method}")
+    finally:
+        # Same as upload_filename, the cached file info may be out of date now.
+        clear_file_info_cache(hostname)
 
 
 def download_file_text(
@@ -177,6 +301,50 @@ def download_file_text(
         raise RuntimeError(f"Unhandled data method {data_method}")
 
 
+def download_file_stream(
+    hostname: str,
+    filename: str,
+    stream: BinaryIO,
+    directory: str | None = None,
+) -> None:
+    """
+    Download a file from the PLC, writing the bytes to an open stream.
+
+    This avoids holding the full file contents in memory, for example
+    when writing the file to stdout or to a local file.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to download from.
+    filename : str
+        The name of the file on the PLC.
+    stream : file-like object
+        A writable binary file-like object, such as sys.stdout.buffer.
+    directory : str, optional
+        The subdirectory to read and write from
+        A default directory is used if this argument is omitted,
+        which depends on the PLC OS.
+    """
+    data_method = get_data_method(hostname=hostname, directory=directory)
+    if data_method == DataMethod.ssh:
+        return ssh_data.download_file_stream(
+            hostname=hostname,
+            filename=filename,
+            stream=stream,
+            directory=directory,
+        )
+    elif data_method == DataMethod.ftp:
+        return ftp_data.download_file_stream(
+            hostname=hostname,
+            filename=filename,
+            stream=stream,
+            directory=directory,
+        )
+    else:
+        raise RuntimeError(f"Unhandled data method {data_method}")
+
+
 def download_file_json_dict(
     hostname: str,
     filename: str,
@@ -210,13 +378,15 @@ def download_file_json_dict(
         filename,
         directory,
     )
-    return json.loads(
-        download_file_text(
-            hostname=hostname,
-            filename=filename,
-            directory=directory,
-        )
+    # Both json parsers take bytes, so skip decoding to text first
+    stream = io.BytesIO()
+    download_file_stream(
+        hostname=hostname,
+        filename=filename,
+        stream=stream,
+        directory=directory,
     )
+    return json_loads(stream.getvalue())
 
 
 def local_file_json_dict(filename: str) -> dict[str, dict[str, Any]]:
@@ -236,8 +406,8 @@ def local_file_json_dict(filename: str) -> dict[str, dict[str, Any]]:
         The dictionary data from the file stored on the local drive.
     """
     logger.debug('local_file_json_dict(%s)', filename)
-    with open(filename, 'r') as fd:
-        return json.load(fd)
+    with open(filename, 'rb') as fd:
+        return json_loads(fd.read())
 
 
 def compare_file(
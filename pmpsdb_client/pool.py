@@ -0,0 +1,194 @@
+"""
+Module to define the connection pool shared by the ftp and ssh interfaces.
+
+Logging in to a PLC costs much more than the small transfers we do, so
+connections are kept for a short time after each use and reused if they
+are still alive. The PLCs only allow a few sessions at once, so we keep
+very few idle connections, close them after a short idle time, and close
+everything on exit.
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Generic, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+C = TypeVar("C")
+
+
+class ConnectionPool(Generic[C]):
+    """
+    Keep logged-in connections around so they can be reused.
+
+    Connections are kept per hostname and directory, up to size idle
+    connections for each. Idle connections are closed by a background
+    thread once they have not been used for idle_timeout seconds.
+
+    Subclasses must implement connect and close, and should implement
+    check to make sure an idle connection still works before reusing it.
+
+    Parameters
+    ----------
+    size : int, optional
+        The maximum number of idle connections to keep for each
+        hostname and directory.
+    idle_timeout : float, optional
+        Close idle connections after this many seconds.
+    """
+    def __init__(self, size: int = 1, idle_timeout: float = 30.0):
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self._pools: dict[tuple[str, str | None], queue.LifoQueue[tuple[C, float]]] = {}
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+
+    def connect(self, hostname: str, directory: str | None) -> C:
+        """
+        Open a new connection.
+        """
+        raise NotImplementedError()
+
+    def check(self, conn: C) -> bool:
+        """
+        Return True if an idle connection can still be used.
+        """
+        return True
+
+    def close(self, conn: C) -> None:
+        """
+        Close a connection, politely if possible.
+        """
+        raise NotImplementedError()
+
+    def _get_pool(
+        self,
+        hostname: str,
+        directory: str | None,
+    ) -> queue.LifoQueue[tuple[C, float]]:
+        with self._lock:
+            try:
+                return self._pools[(hostname, directory)]
+            except KeyError:
+                pool = queue.LifoQueue(maxsize=self.size)
+                self._pools[(hostname, directory)] = pool
+                return pool
+
+    def _get_idle(self, pool: queue.LifoQueue[tuple[C, float]], hostname: str) -> C | None:
+        while True:
+            try:
+                conn, last_used = pool.get_nowait()
+            except queue.Empty:
+                return None
+            if time.monotonic() - last_used >= self.idle_timeout:
+                logger.debug('Dropping idle connection to %s', hostname)
+                self.close(conn)
+                continue
+            try:
+                alive = self.check(conn)
+            except Exception:
+                logger.debug('Connection check failed for %s', hostname, exc_info=True)
+                alive = False
+            if alive:
+                return conn
+            logger.debug('Dropping stale connection to %s', hostname)
+            self.close(conn)
+
+    @contextmanager
+    def acquire(
+        self,
+        hostname: str,
+        directory: str | None = None,
+    ) -> Iterator[C]:
+        """
+        Context manager that checks out a connection from the pool.
+
+        An idle connection is reused if it passes check, otherwise a new
+        connection is opened. The connection is returned to the pool
+        afterwards, unless there was an error while using it.
+        """
+        pool = self._get_pool(hostname, directory)
+        conn = self._get_idle(pool, hostname)
+        if conn is None:
+            conn = self.connect(hostname, directory)
+        else:
+            logger.debug('Reusing connection to %s', hostname)
+        try:
+            yield conn
+        except BaseException:
+            # Can't trust the connection state after an error
+            self.close(conn)
+            raise
+        try:
+            pool.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            self.close(conn)
+        else:
+            self._start_reaper()
+
+    def close_idle(self, max_idle: float | None = None) -> int:
+        """
+        Close the connections that have been idle for at least max_idle seconds.
+
+        max_idle defaults to idle_timeout.
+        Returns the number of idle connections that are still open.
+        """
+        if max_idle is None:
+            max_idle = self.idle_timeout
+        with self._lock:
+            pools = list(self._pools.values())
+        now = time.monotonic()
+        for pool in pools:
+            keep = []
+            while True:
+                try:
+                    conn, last_used = pool.get_nowait()
+                except queue.Empty:
+                    break
+                if now - last_used >= max_idle:
+                    self.close(conn)
+                else:
+                    keep.append((conn, last_used))
+            # Oldest first so the newest is on top of the stack again
+            for item in reversed(keep):
+                try:
+                    pool.put_nowait(item)
+                except queue.Full:
+                    self.close(item[0])
+        with self._lock:
+            return sum(pool.qsize() for pool in self._pools.values())
+
+    def close_all(self) -> None:
+        """
+        Close all of the idle connections.
+        """
+        self.close_idle(max_idle=0)
+
+    def _start_reaper(self) -> None:
+        with self._lock:
+            if self._reaper is not None:
+                return
+            self._reaper = threading.Thread(
+                target=self._reap,
+                name=f'{type(self).__name__}-reaper',
+                daemon=True,
+            )
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        while True:
+            time.sleep(self.idle_timeout / 2)
+            try:
+                self.close_idle()
+            except Exception:
+                logger.debug('Error closing idle connections', exc_info=True)
+            with self._lock:
+                # Count under the lock so a connection returned
+                # just now either sees this thread or starts a new one
+                if any(pool.qsize() for pool in self._pools.values()):
+                    continue
+                self._reaper = None
+                return
@@ -6,19 +6,27 @@ PLCs.
 """
 from __future__ import annotations
 
+import atexit
 import datetime
 import logging
+import re
+import shlex
+import stat
+import tarfile
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import Iterator, TypeVar
-
-from fabric import Connection
-from fabric.config import Config
-from paramiko.config import SSHConfig
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, TypeVar
 
 from .data_types import FileInfo
+from .pool import ConnectionPool
+
+if TYPE_CHECKING:
+    # fabric is slow to import, so only import it when we connect
+    from fabric import Connection
+    from paramiko.sftp_attr import SFTPAttributes
 
 DEFAULT_PW = (
     ("ecs-user", "1"),
@@ -32,11 +40,51 @@ Host *
     PreferredAuthentications=password
 """
 
+# The file type and permissions at the start of an ls -l line, e.g. -rw-r--r--
+LONGNAME_MODE_RE = re.compile(r"^[-bcdlps][-rwxsStT]{9}[.+@]?$")
+KEEPALIVE = 30
+PROBE_TIMEOUT = 2.0
+
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
 
+class SSHPool(ConnectionPool[tuple["Connection", str]]):
+    """
+    Keep logged-in ssh connections around so they can be reused.
+
+    Each new connection costs a TCP handshake, a key exchange, and a login,
+    which is far longer than the small transfers we do here.
+    The pooled items are (connection, directory) pairs from connect.
+    Idle connections are checked with an sftp round trip before they are
+    reused, since is_connected only looks at the local transport state.
+    See ConnectionPool for the parameters.
+    """
+    def connect(self, hostname: str, directory: str | None) -> tuple[Connection, str]:
+        return connect(hostname=hostname, directory=directory)
+
+    def check(self, item: tuple[Connection, str]) -> bool:
+        conn, _ = item
+        if not conn.is_connected:
+            return False
+        sftp = conn.sftp()
+        channel = sftp.get_channel()
+        channel.settimeout(PROBE_TIMEOUT)
+        try:
+            sftp.normalize(".")
+        finally:
+            channel.settimeout(None)
+        return True
+
+    def close(self, item: tuple[Connection, str]) -> None:
+        item[0].close()
+
+
+SSH_POOL = SSHPool()
+atexit.register(SSH_POOL.close_all)
+
+
 @contextmanager
 def ssh(
     hostname: str,
@@ -45,14 +93,38 @@ def ssh(
     """
     Context manager to handle a single ssh connection.
 
+    The connection is taken from and returned to SSH_POOL.
     Within one connection we can do any number of remote operations on the
     TCBSD PLC.
     """
-    connected = False
+    with SSH_POOL.acquire(hostname=hostname, directory=directory) as (conn, conn_dir):
+        # Note: conn.cd only affects calls to conn.run, not conn.get or conn.put
+        # Use conn.cwd property to check this live
+        with conn.cd(conn_dir):
+            yield conn
+
+
+def connect(
+    hostname: str,
+    directory: str | None = None,
+) -> tuple[Connection, str]:
+    """
+    Open a new ssh connection and make sure our directory exists.
+
+    Returns
+    -------
+    conn, directory : tuple of Connection, str
+        The open connection and the directory to work in.
+    """
+    logger.debug("connect(%s, %s)", hostname, directory)
+    from fabric import Connection
+    from fabric.config import Config
+    from paramiko.config import SSHConfig
+
     excs = []
 
     for user, pw in DEFAULT_PW:
-        with Connection(
+        conn = Connection(
             host=hostname,
             user=user,
             config=Config(ssh_config=SSHConfig.from_text(SSH_CONFIG)),
@@ -60,29 +132,35 @@ def ssh(
             connect_kwargs={
                 "password": pw,
                 "allow_agent": False,
+                # Password login only, don't spend time trying local keys
+                "look_for_keys": False,
+                "banner_timeout": 10,
+                # The json database files compress very well
+                "compress": True,
             },
-        ) as conn:
-            try:
-                conn.open()
-            except Exception as exc:
-                excs.append(exc)
-                continue
-            connected = True
-            directory = directory or DIRECTORY.format(user=user)
+        )
+        try:
+            conn.open()
+        except Exception as exc:
+            conn.close()
+            excs.append(exc)
+            continue
+        conn.transport.set_keepalive(KEEPALIVE)
+        directory = directory or DIRECTORY.format(user=user)
+        try:
             result = conn.run(f"mkdir -p {directory}")
             if result.exited != 0:
                 raise RuntimeError(f"Failed to create directory {directory}")
-            # Note: conn.cd only affects calls to conn.run, not conn.get or conn.put
-            # Use conn.cwd property to check this live
-            with conn.cd(directory):
-                yield conn
-    if not connected:
-        if len(excs) > 1:
-            raise RuntimeError(excs)
-        elif excs:
-            raise excs[0]
-        else:
-            raise RuntimeError("Unable to connect to PLC")
+        except BaseException:
+            conn.close()
+            raise
+        return conn, directory
+    if len(excs) > 1:
+        raise RuntimeError(excs)
+    elif excs:
+        raise excs[0]
+    else:
+        raise RuntimeError("Unable to connect to PLC")
 
 
 @dataclass(frozen=True)
@@ -92,33 +170,34 @@ class SSHFileInfo(FileInfo):
 
     Adds extra detail not available through ftp.
     """
+    __slots__ = ('is_directory', 'permissions', 'links', 'user', 'group')
+
     is_directory: bool
     permissions: str
     links: int
     user: str
     group: str
 
-    @staticmethod
-    def get_output_lines(conn: Connection) -> str:
-        return conn.run("ls -l -D %s", hide=True).stdout
-
     @classmethod
-    def from_all_output_lines(cls: type[T], output_lines) -> list[T]:
-        return [cls.from_output_line(line) for line in output_lines.strip().split("\n")[1:]]
-
-    @classmethod
-    def from_output_line(cls: type[T], output: str) -> T:
-        type_perms, links, user, group, size, date, filename = output.strip().split()
+    def from_sftp_attributes(cls: type[T], attrs: SFTPAttributes) -> T:
+        # The numeric fields come straight from the sftp stat.
+        # Links and names are only given in the ls-style longname,
+        # which is up to the server, so use the ids if it doesn't parse.
+        longname = (getattr(attrs, "longname", None) or "").split()
+        if len(longname) >= 5 and LONGNAME_MODE_RE.match(longname[0]) and longname[1].isdigit():
+            links, user, group = int(longname[1]), longname[2], longname[3]
+        else:
+            links, user, group = 1, str(attrs.st_uid), str(attrs.st_gid)
 
         return cls(
-            is_directory=type_perms[0] == "d",
-            permissions=type_perms[1:],
-            links=int(links),
+            is_directory=stat.S_ISDIR(attrs.st_mode),
+            permissions=stat.filemode(attrs.st_mode)[1:],
+            links=links,
             user=user,
             group=group,
-            size=int(size),
-            last_changed=datetime.datetime.fromtimestamp(int(date)),
-            filename=filename,
+            size=attrs.st_size,
+            last_changed=datetime.datetime.fromtimestamp(attrs.st_mtime),
+            filename=attrs.filename,
         )
 
 
@@ -144,8 +223,14 @@ def list_file_info(
     """
     logger.debug("list_file_info(%s, %s)", hostname, directory)
     with ssh(hostname=hostname, directory=directory) as conn:
-        output = SSHFileInfo.get_output_lines(conn)
-    return SSHFileInfo.from_all_output_lines(output)
+        if directory is None:
+            directory = conn.cwd
+        attrs = conn.sftp().listdir_attr(directory)
+    # Skip hidden files, like ls -l does
+    return [
+        SSHFileInfo.from_sftp_attributes(attr) for attr in attrs
+        if not attr.filename.startswith(".")
+    ]
 
 
 def upload_filename(
@@ -178,6 +263,86 @@ def upload_filename(
         conn.put(local=filename, remote=str(Path(directory) / dest_filename))
 
 
+def upload_filenames(
+    hostname: str,
+    filenames: Iterable[str],
+    directory: str | None = None,
+):
+    """
+    Upload many files on your filesystem to a PLC in one transfer.
+
+    The files are streamed as a single tar archive through one ssh channel
+    and unpacked on the PLC, rather than putting each file separately.
+    Each file keeps its base name on the PLC.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to upload to.
+    filenames : iterable of str
+        The names of the files on your filesystem.
+    directory : str, optional
+        The ssh subdirectory to read and write from
+        A default directory /home/ecs-user/pmpsdb is used if this argument is omitted.
+    """
+    filenames = list(filenames)
+    logger.debug("upload_filenames(%s, %s, %s)", hostname, filenames, directory)
+    if len(filenames) == 1:
+        return upload_filename(
+            hostname=hostname,
+            filename=filenames[0],
+            dest_filename=Path(filenames[0]).name,
+            directory=directory,
+        )
+    if not filenames:
+        return
+    with ssh(hostname=hostname, directory=directory) as conn:
+        if directory is None:
+            directory = conn.cwd
+        channel = conn.client.get_transport().open_session()
+        output = []
+        try:
+            # Read tar's messages while we write, or a full stderr window
+            # on the PLC side could stall the upload
+            channel.set_combine_stderr(True)
+            channel.exec_command(f"tar -xf - -C {shlex.quote(directory)}")
+            reader = threading.Thread(
+                target=_read_channel,
+                args=(channel, output),
+                daemon=True,
+            )
+            reader.start()
+            try:
+                with channel.makefile("wb") as stream:
+                    with tarfile.open(fileobj=stream, mode="w|") as tar:
+                        for filename in filenames:
+                            tar.add(filename, arcname=Path(filename).name)
+                channel.shutdown_write()
+            except OSError as exc:
+                # The remote tar exited early, report its exit status below
+                logger.debug("Error sending files to %s: %s", hostname, exc)
+            status = channel.recv_exit_status()
+            reader.join(timeout=5.0)
+        finally:
+            channel.close()
+    if status != 0:
+        message = b"".join(output).decode("utf-8", errors="replace").strip()
+        raise RuntimeError(
+            f"Failed to unpack files in {directory}, exit code {status}: {message}"
+        )
+
+
+def _read_channel(channel, output: list[bytes]) -> None:
+    """
+    Collect everything the remote command prints until it is done.
+    """
+    while True:
+        data = channel.recv(32768)
+        if not data:
+            return
+        output.append(data)
+
+
 def download_file_text(
     hostname: str,
     filename: str,
@@ -206,8 +371,38 @@ def download_file_text(
     """
     logger.debug("download_file_text(%s, %s, %s)", hostname, filename, directory)
     bytesio = BytesIO()
+    download_file_stream(
+        hostname=hostname,
+        filename=filename,
+        stream=bytesio,
+        directory=directory,
+    )
+    return bytesio.getvalue().decode(encoding="utf-8")
+
+
+def download_file_stream(
+    hostname: str,
+    filename: str,
+    stream: BinaryIO,
+    directory: str | None = None,
+) -> None:
+    """
+    Download a file from the PLC, writing the bytes to an open stream.
+
+    Parameters
+    ----------
+    hostname : str
+        The plc hostname to download from.
+    filename : str
+        The name of the file on the PLC.
+    stream : file-like object
+        A writable binary file-like object, such as sys.stdout.buffer.
+    directory : str, optional
+        The ssh subdirectory to read and write from
+        A default directory /home/ecs-user/pmpsdb is used if this argument is omitted.
+    """
+    logger.debug("download_file_stream(%s, %s, %s, %s)", hostname, filename, stream, directory)
     with ssh(hostname=hostname, directory=directory) as conn:
         if directory is None:
             directory = conn.cwd
-        conn.get(remote=str(Path(directory) / filename), local=bytesio)
-    return bytesio.getvalue().decode(encoding="utf-8")
+        conn.get(remote=str(Path(directory) / filename), local=stream)
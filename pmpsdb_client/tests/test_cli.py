@@ -1,6 +1,8 @@
+import pytest
+
 from pmpsdb_client import __version__
-from pmpsdb_client.cli import main
-from pmpsdb_client.cli.parser import create_parser
+from pmpsdb_client.cli import entrypoint, main
+from pmpsdb_client.cli.parser import create_parser, sniff_subcommand
 
 
 def test_version(capsys):
@@ -11,3 +13,65 @@ def test_version(capsys):
     assert main(parser.parse_args(["--version"])) == 0
     captured = capsys.readouterr()
     assert str(__version__) in captured.out
+
+
+def test_version_fast_path(capsys, monkeypatch):
+    """
+    The entrypoint should show the version without building the parser
+    """
+    monkeypatch.setattr("sys.argv", ["pmpsdb", "--version"])
+    monkeypatch.setattr("pmpsdb_client.cli.create_parser", None)
+    assert entrypoint() == 0
+    captured = capsys.readouterr()
+    assert str(__version__) in captured.out
+
+
+@pytest.mark.parametrize(
+    "argv,expected",
+    [
+        ([], ''),
+        (['-v'], ''),
+        (['-h'], ''),
+        (['--help'], ''),
+        (['gui'], 'gui'),
+        (['gui', '-h'], 'gui'),
+        (['-v', 'list-files', 'plc-tst'], 'list-files'),
+        (['-e', 'upload-to', 'compare', 'plc-tst'], 'compare'),
+        (['--export-dir', 'gui', 'list-files', 'plc-tst'], 'list-files'),
+        (['--export', 'gui', 'list-files', 'plc-tst'], 'list-files'),
+        (['--export-dir=gui', 'list-files', 'plc-tst'], 'list-files'),
+        (['not-a-command'], None),
+        (['-e', 'exports', 'not-a-command'], None),
+    ],
+)
+def test_sniff_subcommand(argv, expected):
+    """
+    The subcommand is found even after options that take values
+    """
+    assert sniff_subcommand(argv) == expected
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ['list-files', 'plc-tst'],
+        ['-v', '-e', 'exports', 'upload-to', 'plc-tst', '--local-file', 'file.json'],
+        ['--export-dir=exports', 'gui', '--tst'],
+    ],
+)
+def test_sniffed_parser_matches_full_parser(argv):
+    """
+    Building only the sniffed subcommand parses the same as building them all
+    """
+    sniffed = create_parser(sniff_subcommand(argv)).parse_args(argv)
+    full = create_parser().parse_args(argv)
+    assert sniffed == full
+
+
+def test_unknown_subcommand_is_rejected():
+    """
+    Unknown subcommands get the full parser, which reports the error
+    """
+    argv = ['not-a-command']
+    with pytest.raises(SystemExit):
+        create_parser(sniff_subcommand(argv)).parse_args(argv)
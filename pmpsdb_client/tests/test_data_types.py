@@ -0,0 +1,54 @@
+import copy
+import datetime
+import pickle
+
+import pytest
+
+from pmpsdb_client.data_types import FileInfo
+from pmpsdb_client.ftp_data import FTPFileInfo
+from pmpsdb_client.ssh_data import SSHFileInfo
+
+LAST_CHANGED = datetime.datetime(2024, 1, 1, 12, 30)
+
+file_infos = [
+    FileInfo(filename='plc.json', size=123, last_changed=LAST_CHANGED),
+    FTPFileInfo(filename='plc.json', size=123, last_changed=LAST_CHANGED),
+    SSHFileInfo(
+        filename='plc.json',
+        size=123,
+        last_changed=LAST_CHANGED,
+        is_directory=False,
+        permissions='rw-r--r--',
+        links=1,
+        user='ecs-user',
+        group='wheel',
+    ),
+]
+
+
+@pytest.fixture(params=file_infos, ids=lambda info: type(info).__name__)
+def file_info(request):
+    return request.param
+
+
+def test_file_info_slots(file_info):
+    assert not hasattr(file_info, '__dict__')
+    with pytest.raises(AttributeError):
+        file_info.extra = 1
+
+
+@pytest.mark.parametrize(
+    'round_trip',
+    [
+        lambda obj: pickle.loads(pickle.dumps(obj)),
+        copy.copy,
+        copy.deepcopy,
+    ],
+    ids=['pickle', 'copy', 'deepcopy'],
+)
+def test_file_info_round_trip(file_info, round_trip):
+    other = round_trip(file_info)
+    assert other is not file_info
+    assert type(other) is type(file_info)
+    assert other == file_info
+    assert hash(other) == hash(file_info)
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from pmpsdb_client import export_data
+
+
+@pytest.fixture
+def export_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(export_data, '_export_dir', None)
+    monkeypatch.setattr(export_data, '_latest_exports_cache', None)
+    export_data.set_export_dir(tmp_path)
+    return tmp_path
+
+
+def add_export(export_dir, filename):
+    # Keep the directory mtime fixed, like a coarse mtime on NFS would
+    stat = os.stat(export_dir)
+    (export_dir / filename).write_text('{}')
+    os.utime(export_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+
+def test_latest_exported_files(export_dir):
+    add_export(export_dir, 'exported_plc-tst-2024-01-01T00:00:00.000000.json')
+    add_export(export_dir, 'exported_plc-tst-2024-01-02T00:00:00.000000.json')
+    add_export(export_dir, 'exported_plc-other-2024-01-01T00:00:00.000000.json')
+    add_export(export_dir, 'notes.txt')
+    latest = export_data.get_latest_exported_files()
+    assert sorted(latest) == ['plc-other', 'plc-tst']
+    assert latest['plc-tst'].filename == 'exported_plc-tst-2024-01-02T00:00:00.000000.json'
+
+
+def test_latest_exported_files_new_export(export_dir):
+    add_export(export_dir, 'exported_plc-tst-2024-01-01T00:00:00.000000.json')
+    first = export_data.get_latest_exported_files()
+    assert first['plc-tst'].filename == 'exported_plc-tst-2024-01-01T00:00:00.000000.json'
+
+    mtime = os.stat(export_dir).st_mtime_ns
+    add_export(export_dir, 'exported_plc-tst-2024-01-02T00:00:00.000000.json')
+    assert os.stat(export_dir).st_mtime_ns == mtime
+    second = export_data.get_latest_exported_files()
+    assert second['plc-tst'].filename == 'exported_plc-tst-2024-01-02T00:00:00.000000.json'
+
+
+def test_latest_exported_files_reused(export_dir, monkeypatch):
+    add_export(export_dir, 'exported_plc-tst-2024-01-01T00:00:00.000000.json')
+    export_data.get_latest_exported_files()
+
+    def get_exported_files():
+        raise AssertionError('Listing did not change, should use the cache')
+
+    monkeypatch.setattr(export_data, 'get_exported_files', get_exported_files)
+    latest = export_data.get_latest_exported_files()
+    assert sorted(latest) == ['plc-tst']
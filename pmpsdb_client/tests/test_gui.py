@@ -1,5 +1,80 @@
+import collections
+import dataclasses
+import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from pmpsdb_client.data_types import FileInfo
+
+
 def test_gui_imports():
     """
     Minimal test that we can import the items needed to run the gui
     """
     import pmpsdb_client.cli.run_gui  # noqa: F401
+
+
+@pytest.fixture
+def fake_plc_db(monkeypatch):
+    """
+    Fake PLC with one db file, counting the downloads.
+    """
+    from pmpsdb_client import gui
+
+    state = {
+        'info': [
+            FileInfo(
+                filename=gui.hostname_to_filename('plc-tst-a'),
+                size=10,
+                last_changed=datetime.datetime(2024, 1, 1),
+            )
+        ],
+        'downloads': 0,
+    }
+
+    def download_file_json_dict(hostname, filename):
+        state['downloads'] += 1
+        return {'download': state['downloads']}
+
+    monkeypatch.setattr(gui, 'list_file_info_cached', lambda hostname: state['info'])
+    monkeypatch.setattr(gui, 'download_file_json_dict', download_file_json_dict)
+    return state
+
+
+def test_download_db_reuses_unchanged(fake_plc_db):
+    from pmpsdb_client.gui import SummaryTables
+
+    hostname, db, fingerprint, generation = SummaryTables._download_db('plc-tst-a')
+    assert db == {'download': 1}
+    assert generation == 0
+    result = SummaryTables._download_db('plc-tst-a', (fingerprint, db), 3)
+    assert result == ('plc-tst-a', db, fingerprint, 3)
+    assert result[1] is db
+    assert fake_plc_db['downloads'] == 1
+
+
+def test_download_db_changed_file(fake_plc_db):
+    from pmpsdb_client.gui import SummaryTables
+
+    _, db, fingerprint, _ = SummaryTables._download_db('plc-tst-a')
+    fake_plc_db['info'] = [dataclasses.replace(fake_plc_db['info'][0], size=11)]
+    _, new_db, new_fingerprint, _ = SummaryTables._download_db('plc-tst-a', (fingerprint, db))
+    assert new_db == {'download': 2}
+    assert new_fingerprint != fingerprint
+
+
+def test_cache_db_discards_stale_generation():
+    from pmpsdb_client.gui import SummaryTables
+
+    tables = SimpleNamespace(_db_cache={}, _upload_generation=collections.Counter())
+    # A download that started before an upload finished
+    tables._upload_generation['plc-tst-a'] += 1
+    SummaryTables._cache_db(tables, 'plc-tst-a', {'old': 1}, ('fingerprint',), 0)
+    assert tables._db_cache == {}
+    # Failed downloads and unknown fingerprints are not cached either
+    SummaryTables._cache_db(tables, 'plc-tst-a', None, ('fingerprint',), 1)
+    SummaryTables._cache_db(tables, 'plc-tst-a', {'new': 1}, None, 1)
+    assert tables._db_cache == {}
+    SummaryTables._cache_db(tables, 'plc-tst-a', {'new': 1}, ('fingerprint',), 1)
+    assert tables._db_cache == {'plc-tst-a': (('fingerprint',), {'new': 1})}
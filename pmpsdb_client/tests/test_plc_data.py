@@ -0,0 +1,101 @@
+import datetime
+
+import pytest
+
+from pmpsdb_client import plc_data
+from pmpsdb_client.data_types import FileInfo
+
+
+@pytest.fixture
+def fake_plc(monkeypatch):
+    """
+    Fake ssh PLC that counts list calls and runs on a fake clock.
+    """
+    state = {'now': 100.0, 'calls': 0}
+
+    def list_file_info(hostname, directory=None):
+        state['calls'] += 1
+        return [
+            FileInfo(
+                filename=f'file{state["calls"]}.json',
+                size=1,
+                last_changed=datetime.datetime(2024, 1, 1),
+            )
+        ]
+
+    monkeypatch.setattr(plc_data.time, 'monotonic', lambda: state['now'])
+    monkeypatch.setattr(plc_data.ssh_data, 'list_file_info', list_file_info)
+    monkeypatch.setattr(plc_data.ssh_data, 'upload_filename', lambda **kwargs: None)
+    monkeypatch.setattr(plc_data, 'plc_mapping', {'plc': plc_data.DataMethod.ssh})
+    monkeypatch.setattr(plc_data, 'file_info_cache', {})
+    monkeypatch.setattr(plc_data, 'file_info_generation', plc_data.collections.Counter())
+    return state
+
+
+def test_file_info_cache_hit(fake_plc):
+    first = plc_data.list_file_info_cached('plc')
+    fake_plc['now'] += plc_data.FILE_INFO_TTL - 1
+    assert plc_data.list_file_info_cached('plc') is first
+    assert fake_plc['calls'] == 1
+
+
+def test_file_info_cache_expiry(fake_plc):
+    first = plc_data.list_file_info_cached('plc')
+    fake_plc['now'] += plc_data.FILE_INFO_TTL
+    second = plc_data.list_file_info_cached('plc')
+    assert second is not first
+    assert second[0].filename == 'file2.json'
+    assert fake_plc['calls'] == 2
+
+
+def test_file_info_cache_cleared_on_upload(fake_plc):
+    plc_data.list_file_info_cached('plc')
+    plc_data.upload_filename('plc', 'file.json')
+    plc_data.list_file_info_cached('plc')
+    assert fake_plc['calls'] == 2
+
+
+def test_file_info_cache_cleared_on_failed_upload(fake_plc, monkeypatch):
+    def upload_filename(**kwargs):
+        raise OSError('lost connection')
+
+    monkeypatch.setattr(plc_data.ssh_data, 'upload_filename', upload_filename)
+    plc_data.list_file_info_cached('plc')
+    with pytest.raises(OSError):
+        plc_data.upload_filename('plc', 'file.json')
+    plc_data.list_file_info_cached('plc')
+    assert fake_plc['calls'] == 2
+
+
+def test_file_info_cache_cleared_on_multi_upload(fake_plc, monkeypatch):
+    uploaded = []
+    monkeypatch.setattr(
+        plc_data.ssh_data,
+        'upload_filenames',
+        lambda **kwargs: uploaded.append(kwargs['filenames']),
+    )
+    plc_data.list_file_info_cached('plc')
+    plc_data.upload_filenames('plc', ['a.json', 'b.json'])
+    plc_data.list_file_info_cached('plc')
+    assert uploaded == [['a.json', 'b.json']]
+    assert fake_plc['calls'] == 2
+
+
+def test_file_info_cache_skips_listing_from_before_upload(fake_plc, monkeypatch):
+    list_file_info = plc_data.ssh_data.list_file_info
+
+    def slow_list_file_info(hostname, directory=None):
+        # The listing is read, then an upload finishes before it returns
+        file_info = list_file_info(hostname, directory)
+        plc_data.upload_filename('plc', 'file.json')
+        return file_info
+
+    monkeypatch.setattr(plc_data.ssh_data, 'list_file_info', slow_list_file_info)
+    stale = plc_data.list_file_info_cached('plc')
+    assert stale[0].filename == 'file1.json'
+    assert not plc_data.file_info_cache
+
+    monkeypatch.setattr(plc_data.ssh_data, 'list_file_info', list_file_info)
+    fresh = plc_data.list_file_info_cached('plc')
+    assert fresh[0].filename == 'file2.json'
+    assert plc_data.list_file_info_cached('plc') is fresh
@@ -0,0 +1,144 @@
+import ftplib
+import time
+
+import pytest
+
+from pmpsdb_client import ftp_data, pool
+
+
+class FakeFTP:
+    """
+    Stands in for a logged-in ftplib.FTP.
+    """
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+
+    def voidcmd(self, cmd):
+        assert cmd == 'NOOP'
+        if not self.alive:
+            raise ftplib.error_temp('421 Service not available')
+        return '200 NOOP'
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    state = {'now': 1000.0}
+    monkeypatch.setattr(pool.time, 'monotonic', lambda: state['now'])
+    return state
+
+
+@pytest.fixture
+def ftp_pool(monkeypatch, clock):
+    opened = []
+
+    def connect(hostname, directory=None):
+        ftp_obj = FakeFTP()
+        opened.append(ftp_obj)
+        return ftp_obj
+
+    monkeypatch.setattr(ftp_data, 'connect', connect)
+    ftp_pool = ftp_data.FTPPool(size=1, idle_timeout=30.0)
+    # Don't leave reaper threads sleeping in the test process
+    monkeypatch.setattr(ftp_pool, '_start_reaper', lambda: None)
+    ftp_pool.opened = opened
+    return ftp_pool
+
+
+def test_pool_reuse(ftp_pool):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    with ftp_pool.acquire('plc', 'pmps') as second:
+        ...
+    assert first is second
+    assert len(ftp_pool.opened) == 1
+    assert not first.closed
+
+
+def test_pool_separate_directories(ftp_pool):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    with ftp_pool.acquire('plc', 'other') as second:
+        ...
+    assert first is not second
+
+
+def test_pool_drops_stale(ftp_pool):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    first.alive = False
+    with ftp_pool.acquire('plc', 'pmps') as second:
+        ...
+    assert second is not first
+    assert first.closed
+    assert not second.closed
+
+
+def test_pool_close_on_error(ftp_pool):
+    with pytest.raises(RuntimeError):
+        with ftp_pool.acquire('plc', 'pmps') as first:
+            raise RuntimeError('transfer failed')
+    assert first.closed
+    with ftp_pool.acquire('plc', 'pmps') as second:
+        ...
+    assert second is not first
+
+
+def test_pool_close_on_full(ftp_pool):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        with ftp_pool.acquire('plc', 'pmps') as second:
+            ...
+    # The pool holds one idle connection, so the second one back is closed
+    assert not second.closed
+    assert first.closed
+
+
+def test_pool_idle_timeout(ftp_pool, clock):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    clock['now'] += 10
+    assert ftp_pool.close_idle() == 1
+    assert not first.closed
+    clock['now'] += 20
+    assert ftp_pool.close_idle() == 0
+    assert first.closed
+
+
+def test_pool_expired_not_reused(ftp_pool, clock):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    clock['now'] += 30
+    with ftp_pool.acquire('plc', 'pmps') as second:
+        ...
+    assert second is not first
+    assert first.closed
+
+
+def test_pool_close_all(ftp_pool):
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    with ftp_pool.acquire('plc', 'other') as second:
+        ...
+    ftp_pool.close_all()
+    assert first.closed
+    assert second.closed
+    assert ftp_pool.close_idle() == 0
+
+
+def test_pool_reaper(monkeypatch):
+    monkeypatch.setattr(ftp_data, 'connect', lambda hostname, directory=None: FakeFTP())
+    ftp_pool = ftp_data.FTPPool(size=1, idle_timeout=0.05)
+    with ftp_pool.acquire('plc', 'pmps') as first:
+        ...
+    for _ in range(100):
+        if first.closed and ftp_pool._reaper is None:
+            break
+        time.sleep(0.01)
+    assert first.closed
+    assert ftp_pool._reaper is None
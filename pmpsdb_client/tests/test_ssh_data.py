@@ -0,0 +1,259 @@
+import io
+import tarfile
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from pmpsdb_client import ssh_data
+
+
+class FakeChannel:
+    """
+    Records what upload_filenames sends over the ssh channel.
+    """
+    def __init__(self, status=0, output=b''):
+        self.command = None
+        self.sent = b''
+        self.closed = False
+        self.combine_stderr = False
+        self.status = status
+        self.output = [output] if output else []
+
+    def set_combine_stderr(self, combine):
+        self.combine_stderr = combine
+
+    def exec_command(self, command):
+        self.command = command
+
+    def recv(self, nbytes):
+        return self.output.pop(0) if self.output else b''
+
+    def makefile(self, mode):
+        channel = self
+
+        class Stream(io.BytesIO):
+            def close(self):
+                channel.sent = self.getvalue()
+                super().close()
+
+        return Stream()
+
+    def shutdown_write(self):
+        ...
+
+    def recv_exit_status(self):
+        return self.status
+
+    def close(self):
+        self.closed = True
+
+
+def upload_with_channel(channel, tmp_path, monkeypatch, directory=None):
+    conn = SimpleNamespace(
+        cwd='/home/ecs-user/pmpsdb',
+        client=SimpleNamespace(
+            get_transport=lambda: SimpleNamespace(open_session=lambda: channel),
+        ),
+    )
+
+    @contextmanager
+    def ssh(hostname, directory=None):
+        yield conn
+
+    monkeypatch.setattr(ssh_data, 'ssh', ssh)
+    filenames = []
+    for num in range(3):
+        path = tmp_path / f'plc-{num}.json'
+        path.write_text(f'{{"num": {num}}}')
+        filenames.append(str(path))
+
+    ssh_data.upload_filenames('plc', filenames, directory=directory)
+
+
+def test_upload_filenames_tar(tmp_path, monkeypatch):
+    channel = FakeChannel()
+    upload_with_channel(channel, tmp_path, monkeypatch)
+
+    assert channel.command == 'tar -xf - -C /home/ecs-user/pmpsdb'
+    assert channel.combine_stderr
+    assert channel.closed
+    with tarfile.open(fileobj=io.BytesIO(channel.sent)) as tar:
+        assert tar.getnames() == ['plc-0.json', 'plc-1.json', 'plc-2.json']
+        assert tar.extractfile('plc-2.json').read() == b'{"num": 2}'
+
+
+def test_upload_filenames_quotes_directory(tmp_path, monkeypatch):
+    channel = FakeChannel()
+    upload_with_channel(channel, tmp_path, monkeypatch, directory='/tmp/pmps db;rm')
+    assert channel.command == "tar -xf - -C '/tmp/pmps db;rm'"
+
+
+def test_upload_filenames_error_output(tmp_path, monkeypatch):
+    channel = FakeChannel(status=2, output=b'tar: pmpsdb: Cannot open: Permission denied\n')
+    with pytest.raises(RuntimeError, match='exit code 2: tar: pmpsdb: Cannot open'):
+        upload_with_channel(channel, tmp_path, monkeypatch)
+    assert channel.closed
+
+
+class FakeConnection:
+    """
+    Stands in for a fabric Connection in the pool tests.
+    """
+    def __init__(self):
+        self.is_connected = True
+        self.responsive = True
+        self.closed = False
+        self.cd_calls = []
+        self.timeouts = []
+
+    @contextmanager
+    def cd(self, directory):
+        self.cd_calls.append(directory)
+        yield
+
+    def sftp(self):
+        conn = self
+
+        def normalize(path):
+            if not conn.responsive:
+                raise OSError('Socket is closed')
+            return '/home/ecs-user/pmpsdb'
+
+        return SimpleNamespace(
+            get_channel=lambda: SimpleNamespace(settimeout=conn.timeouts.append),
+            normalize=normalize,
+        )
+
+    def close(self):
+        self.closed = True
+        self.is_connected = False
+
+
+@pytest.fixture
+def ssh_pool(monkeypatch):
+    opened = []
+
+    def connect(hostname, directory=None):
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn, directory or '/home/ecs-user/pmpsdb'
+
+    monkeypatch.setattr(ssh_data, 'connect', connect)
+    ssh_pool = ssh_data.SSHPool()
+    monkeypatch.setattr(ssh_pool, '_start_reaper', lambda: None)
+    monkeypatch.setattr(ssh_data, 'SSH_POOL', ssh_pool)
+    ssh_pool.opened = opened
+    return ssh_pool
+
+
+def test_ssh_pool_reuse(ssh_pool):
+    with ssh_data.ssh('plc') as first:
+        ...
+    with ssh_data.ssh('plc') as second:
+        ...
+    assert first is second
+    assert len(ssh_pool.opened) == 1
+    assert first.cd_calls == ['/home/ecs-user/pmpsdb'] * 2
+    # The probe has a timeout, which is cleared afterwards
+    assert first.timeouts == [ssh_data.PROBE_TIMEOUT, None]
+
+
+def test_ssh_pool_drops_unresponsive(ssh_pool):
+    with ssh_data.ssh('plc') as first:
+        ...
+    # Still looks connected locally, but the round trip fails
+    first.responsive = False
+    with ssh_data.ssh('plc') as second:
+        ...
+    assert second is not first
+    assert first.closed
+    assert not second.closed
+
+
+def test_ssh_pool_drops_disconnected(ssh_pool):
+    with ssh_data.ssh('plc') as first:
+        ...
+    first.is_connected = False
+    with ssh_data.ssh('plc') as second:
+        ...
+    assert second is not first
+    assert first.closed
+    assert first.timeouts == []
+
+
+def test_ssh_pool_close_on_error(ssh_pool):
+    with pytest.raises(OSError):
+        with ssh_data.ssh('plc') as first:
+            raise OSError('transfer failed')
+    assert first.closed
+    ssh_pool.close_all()
+    assert ssh_pool.close_idle() == 0
+
+
+def fake_attrs(filename, longname=None, mode=0o100644):
+    attrs = SimpleNamespace(
+        filename=filename,
+        st_mode=mode,
+        st_size=123,
+        st_mtime=1700000000,
+        st_uid=1000,
+        st_gid=100,
+    )
+    if longname is not None:
+        attrs.longname = longname
+    return attrs
+
+
+def test_sftp_attributes_longname():
+    info = ssh_data.SSHFileInfo.from_sftp_attributes(fake_attrs(
+        'plc.json',
+        '-rw-r--r--    1 ecs-user  wheel  123 Nov 14  2023 plc.json',
+    ))
+    assert info.filename == 'plc.json'
+    assert info.size == 123
+    assert not info.is_directory
+    assert info.permissions == 'rw-r--r--'
+    assert (info.links, info.user, info.group) == (1, 'ecs-user', 'wheel')
+
+
+def test_sftp_attributes_directory():
+    info = ssh_data.SSHFileInfo.from_sftp_attributes(fake_attrs(
+        'old',
+        'drwxr-xr-x    2 ecs-user  wheel  512 Nov 14  2023 old',
+        mode=0o040755,
+    ))
+    assert info.is_directory
+    assert info.permissions == 'rwxr-xr-x'
+    assert info.links == 2
+
+
+@pytest.mark.parametrize(
+    'longname',
+    [
+        None,
+        '',
+        'plc.json',
+        '11-14-23  10:00AM  123 plc.json',
+        '-rw-r--r--  ? ecs-user wheel 123 Nov 14 2023 plc.json',
+    ],
+)
+def test_sftp_attributes_longname_fallback(longname):
+    info = ssh_data.SSHFileInfo.from_sftp_attributes(fake_attrs('plc.json', longname))
+    assert (info.links, info.user, info.group) == (1, '1000', '100')
+    assert info.permissions == 'rw-r--r--'
+
+
+def test_list_file_info_skips_hidden(monkeypatch):
+    attrs = [fake_attrs('.cshrc'), fake_attrs('plc.json'), fake_attrs('.ssh', mode=0o040700)]
+    conn = SimpleNamespace(
+        cwd='/home/ecs-user/pmpsdb',
+        sftp=lambda: SimpleNamespace(listdir_attr=lambda directory: attrs),
+    )
+
+    @contextmanager
+    def ssh(hostname, directory=None):
+        yield conn
+
+    monkeypatch.setattr(ssh_data, 'ssh', ssh)
+    assert [info.filename for info in ssh_data.list_file_info('plc')] == ['plc.json']